@@ -24,17 +24,22 @@
 
 """Provides extensions for new or existing controls."""
 
+from bisect import bisect_left
 from enum import Enum
 import os
 from pathlib import Path
 import re
 from typing import (
     Any,
+    Callable,
     Dict,  # noqa: F401  #used in a typing annotation
+    Iterable,
     List,
     Optional,
+    Set,  # noqa: F401  # used in a typing annotation
     Tuple,
 )
+from weakref import WeakKeyDictionary
 
 from scade.tool.suite.gui.dialogs import browse_directory, file_open, file_save
 from scade.tool.suite.gui.widgets import (
@@ -51,8 +56,136 @@ from scade.tool.suite.gui.widgets import (
 
 import ansys.scade.guitools.csts as c
 
+# beginning of a word in a name, after a separator
+_WORD_START = re.compile(r'(?<=[^0-9a-z_])[0-9a-z_]')
 
-class PushButton(Button):
+ItemProvider = Callable[[], List[Any]]
+"""Signature for computing the items of a combo box."""
+
+
+def get_items_fingerprint(items: List[Any]) -> Tuple[int, int]:
+    """
+    Return a fingerprint of a list of items, to detect whether it is modified.
+
+    The fingerprint is made of the length of the list and a hash of the items,
+    or of their identities when the items are not hashable.
+
+    Parameters
+    ----------
+    items : List[Any]
+        Input items.
+
+    Returns
+    -------
+    Tuple[int, int]
+    """
+    try:
+        return len(items), hash(tuple(items))
+    except TypeError:
+        return len(items), hash(tuple(id(_) for _ in items))
+
+
+# maximum number of providers cached for a model: the providers created for each build
+# of a page, for example lambdas, never hit the cache and must not accumulate
+_MAX_PROVIDERS = 16
+
+# items computed by the providers, indexed by model and by provider: the models
+# are weakly referenced, so that the items are released with their models
+_provided_items = WeakKeyDictionary()  # type: WeakKeyDictionary[Any, Dict[ItemProvider, List[Any]]]
+# items computed for the models that can't be weakly referenced, for example None,
+# indexed by identity of the models
+_strong_provided_items = {}  # type: Dict[int, Tuple[Any, Dict[ItemProvider, List[Any]]]]
+
+
+def get_provided_items(provider: ItemProvider, model: Any = None) -> List[Any]:
+    """
+    Return the items computed by a provider for a model, cached until the model is unloaded.
+
+    The cache is shared by the controls, so that the items are not computed again
+    when a page is built again, for example when the selection changes.
+
+    Parameters
+    ----------
+    provider : ItemProvider
+        Function computing the items. The providers are compared by equality:
+        a module function, or a bound method of an object outliving the page,
+        hits the cache, whereas a new lambda computes the items again.
+
+    model : Any
+        Model the items are computed for, for example a SCADE session.
+
+    Returns
+    -------
+    List[Any]
+    """
+    try:
+        cache = _provided_items.setdefault(model, {})
+    except TypeError:
+        # the model can't be weakly referenced
+        _, cache = _strong_provided_items.setdefault(id(model), (model, {}))
+    items = cache.get(provider)
+    if items is None:
+        items = provider()
+        if len(cache) >= _MAX_PROVIDERS:
+            # discard the oldest entry
+            del cache[next(iter(cache))]
+        cache[provider] = items
+    return items
+
+
+def clear_provided_items():
+    """
+    Discard the items cached for all the models.
+
+    This function must be called when a model is unloaded. The GUI host
+    registers it with ``scade.tool.suite.gui.register_unload_model_callable``.
+    """
+    _provided_items.clear()
+    _strong_provided_items.clear()
+
+
+# state of a control not known, the native control must be queried
+_UNKNOWN = object()
+
+
+class ShadowWidget:
+    """
+    Base class for the controls keeping a shadow copy of their visibility and enabled state.
+
+    Showing or enabling a control in its current state does not call the native control.
+    The derived classes update their additional native controls, for example a label,
+    by overriding :meth:`apply_visible` or :meth:`apply_enable`.
+    """
+
+    # last known states, unknown until set
+    _visible = _UNKNOWN  # type: Any
+    _enable = _UNKNOWN  # type: Any
+    # whether the user has modified the value of the control, set by the controls
+    # intercepting the user's modifications and reset by the data exchange classes
+    user_modified = False
+
+    def set_visible(self, show: bool):
+        """Show or hide the control, unless it is already in this state."""
+        if show != self._visible:
+            self._visible = show
+            self.apply_visible(show)
+
+    def set_enable(self, enable: bool):
+        """Enable or disable the control, unless it is already in this state."""
+        if enable != self._enable:
+            self._enable = enable
+            self.apply_enable(enable)
+
+    def apply_visible(self, show: bool):
+        """Show or hide the native controls."""
+        super().set_visible(show)  # type: ignore
+
+    def apply_enable(self, enable: bool):
+        """Enable or disable the native controls."""
+        super().set_enable(enable)  # type: ignore
+
+
+class PushButton(ShadowWidget, Button):
     """
     Defines a button control with a default size.
 
@@ -94,7 +227,7 @@ class PushButton(Button):
         super().__init__(owner, name, x, y, w, h, **kwargs)
 
 
-class Edit(EditBox):
+class Edit(ShadowWidget, EditBox):
     """
     Defines a edit box control with a default height.
 
@@ -121,13 +254,38 @@ class Edit(EditBox):
 
     def __init__(self, owner, x: int, y: int, w: int, h: int = c.EDIT_HEIGHT, **kwargs):
         """Initialize the edit control with the given parameters."""
-        super().__init__(owner, x, y, w, h, **kwargs)
+        # intercept the modifications of the text to invalidate the shadow text
+        self._on_change = kwargs.pop('on_change', None)
+        # last known text, unknown until set or read
+        self._name = _UNKNOWN  # type: Any
+        super().__init__(owner, x, y, w, h, on_change=self._on_user_change, **kwargs)
         self.owner = owner
 
+    def _on_user_change(self, *args):
+        """Invalidate the shadow text, record the modification, and call the client's callback."""
+        self._name = _UNKNOWN
+        self.user_modified = True
+        if self._on_change:
+            self._on_change(*args)
+
     def on_layout(self):
         """Declare the constraints with respect to the owner."""
         self.set_constraint(Widget.RIGHT, self.owner, Widget.RIGHT, -c.RIGHT_MARGIN)
 
+    def get_name(self) -> str:
+        """Return the text of the control."""
+        if self._name is _UNKNOWN:
+            # wrong signature for EditBox.get_name()
+            self._name = super().get_name()  # type: ignore
+        return self._name
+
+    def set_name(self, name: str):
+        """Set the text of the control, unless it is already the same."""
+        if name != self._name:
+            super().set_name(name)
+            # set after the native call, which may notify a change
+            self._name = name
+
 
 class StaticEdit(Edit):
     """
@@ -176,9 +334,9 @@ class StaticEdit(Edit):
         super().__init__(owner, x + wl, y, w - wl, h, **kwargs)
         self.owner = owner
 
-    def set_visible(self, show: bool):
-        """Show or hide the control."""
-        super().set_visible(show)
+    def apply_visible(self, show: bool):
+        """Show or hide the native controls."""
+        super().apply_visible(show)
         self.label.set_visible(show)
 
 
@@ -320,13 +478,13 @@ class FileSelector(StaticEdit):
         )
         self.set_constraint(Widget.RIGHT, self.btn_dots, Widget.LEFT, -self._SEPARATOR)
 
-    def set_visible(self, show: bool):
-        """Show or hide the control."""
-        super().set_visible(show)
+    def apply_visible(self, show: bool):
+        """Show or hide the native controls."""
+        super().apply_visible(show)
         self.btn_dots.set_visible(show)
 
 
-class CheckButton(CheckBox):
+class CheckButton(ShadowWidget, CheckBox):
     """
     Defines a check box control with a default height.
 
@@ -365,11 +523,34 @@ class CheckButton(CheckBox):
         **kwargs,
     ):
         """Initialize the check button with the given parameters."""
-        super().__init__(owner, text, x, y, w, h, **kwargs)
+        # intercept the clicks to invalidate the shadow state
+        self._on_click = kwargs.pop('on_click', None)
+        # last known state, unknown until set or read
+        self._check = _UNKNOWN  # type: Any
+        super().__init__(owner, text, x, y, w, h, on_click=self._on_user_click, **kwargs)
         self.owner = owner
 
+    def _on_user_click(self, button: CheckBox):
+        """Invalidate the shadow state and call the client's callback, if any."""
+        self._check = _UNKNOWN
+        self.user_modified = True
+        if self._on_click:
+            self._on_click(button)
 
-class ComboBox(_ComboBox):
+    def get_check(self) -> bool:
+        """Return the state of the check button."""
+        if self._check is _UNKNOWN:
+            self._check = super().get_check()
+        return self._check
+
+    def set_check(self, check: bool):
+        """Set the state of the check button, unless it is already the same."""
+        if check != self._check:
+            super().set_check(check)
+            self._check = check
+
+
+class ComboBox(ShadowWidget, _ComboBox):
     """
     Defines a combo box control with a default height.
 
@@ -396,15 +577,118 @@ class ComboBox(_ComboBox):
 
     def __init__(self, owner, x: int, y: int, w: int, h: int = c.COMBO_BOX_HEIGHT, **kwargs):
         """Initialize the combo box with the given parameters."""
-        super().__init__(owner, [], x, y, w, h, **kwargs)
+        # intercept the modifications of the selection to invalidate the shadow text
+        self._on_change_selection = kwargs.pop('on_change_selection', None)
+        # the text of an editable combo box can be modified without notification
+        self._shadowed = 'dropdownlist' in (kwargs.get('style') or [])
+        # last known text, unknown until set or read
+        self._name = _UNKNOWN  # type: Any
+        super().__init__(
+            owner, [], x, y, w, h, on_change_selection=self._on_user_change_selection, **kwargs
+        )
         self.owner = owner
+        # optional provider of the items, and model to compute the items for
+        self.provider = None  # type: Optional[ItemProvider]
+        self.provider_model = None  # type: Any
+        self._items_pending = False
+        self.items = []  # type: List[str]
+        # fingerprint and set of the items of the native control
+        self._fingerprint = get_items_fingerprint([])
+        self._native_items = set()  # type: Set[str]
+
+    def _on_user_change_selection(self, *args):
+        """Invalidate the shadow text, record the modification, and call the client's callback."""
+        self._name = _UNKNOWN
+        self.user_modified = True
+        if self._on_change_selection:
+            self._on_change_selection(*args)
 
     def on_layout(self):
         """Declare the constraints with respect to the owner."""
         self.set_constraint(Widget.RIGHT, self.owner, Widget.RIGHT, -c.RIGHT_MARGIN)
 
+    def set_items(self, items: List[str]):
+        """
+        Set the combo box items.
 
-class ObjectComboBox(_ObjectComboBox):
+        The native control is not updated when the items are the same as the current ones.
+        """
+        self._items_pending = False
+        self.items = items
+        fingerprint = get_items_fingerprint(items)
+        if fingerprint != self._fingerprint:
+            super().set_items(items)
+            self._fingerprint = fingerprint
+            self._native_items = set(items)
+            self._name = _UNKNOWN
+
+    def add_items(self, items: List[str]):
+        """Add items at the end of the combo box, the selection is kept."""
+        self.load_items()
+        self._update_items(self.items + items)
+
+    def remove_items(self, items: List[str]):
+        """Remove items from the combo box, the selection is kept if not removed."""
+        self.load_items()
+        removed = set(items)
+        self._update_items([_ for _ in self.items if _ not in removed])
+
+    def _update_items(self, items: List[str]):
+        """Set the items and restore the selection, if still present."""
+        name = self.get_name()
+        self.set_items(items)
+        if name in items:
+            self.set_name(name)
+
+    def set_item_provider(self, provider: ItemProvider, model: Any = None):
+        """
+        Set a function computing the items, called only when the items are needed.
+
+        The items are cached per model, so that the subsequent builds
+        of the page do not compute them again.
+
+        Parameters
+        ----------
+        provider : ItemProvider
+            Function computing the items, see :func:`get_provided_items`.
+
+        model : Any
+            Model the items are computed for.
+        """
+        self.provider = provider
+        self.provider_model = model
+        self._items_pending = True
+
+    def load_items(self):
+        """Populate the combo box with the items of the provider, if not already done."""
+        if self._items_pending:
+            assert self.provider is not None  # nosec B101  # addresses linter
+            self.set_items(get_provided_items(self.provider, self.provider_model))
+
+    def set_name(self, name: str):
+        """
+        Set the text of the combo box, unless it is already the same.
+
+        The items are populated from the provider, if any.
+        """
+        self.load_items()
+        if self.get_name() != name:
+            super().set_name(name)
+            # a drop-down list displays only its items
+            shadowed = self._shadowed and name in self._native_items
+            self._name = name if shadowed else _UNKNOWN
+
+    def get_name(self) -> str:
+        """Return the text of the combo box."""
+        if self._name is not _UNKNOWN:
+            return self._name
+        name = super().get_name()
+        if self._shadowed:
+            self._name = name
+        return name
+
+
+class ObjectComboBox(ShadowWidget, _ObjectComboBox):
     """
     Defines an object combo box control with a default height and extensions for serialization.
 
@@ -432,43 +716,252 @@ class ObjectComboBox(_ObjectComboBox):
         Other parameters of ``scade.tool.suite.gui.widgets.ComboBox``.
     """
 
+    MORE_ITEMS = '...'
+    """Entry displayed after the current value when the items of the provider are not loaded."""
+
     def __init__(self, owner, x: int, y: int, w: int, h: int = c.COMBO_BOX_HEIGHT, **kwargs):
         """Initialize the object combo box with the given parameters."""
-        super().__init__(owner, [], x, y, w, h, **kwargs)
+        # intercept the modifications of the selection to invalidate the shadow selection
+        self._on_change_selection = kwargs.pop('on_change_selection', None)
+        # the text of an editable combo box can be modified without notification
+        self._shadowed = 'dropdownlist' in (kwargs.get('style') or [])
+        # last known selection, unknown until set or read
+        self._selection = _UNKNOWN  # type: Any
+        super().__init__(
+            owner, [], x, y, w, h, on_change_selection=self._on_user_change_selection, **kwargs
+        )
         self.owner = owner
         self.items = []  # type: List[Any]
         self.names = []  # type: List[str]
+        # indexes of the mapping
+        self._items_by_name = {}  # type: Dict[str, Any]
+        self._names_by_item = {}  # type: Dict[Any, str]
+        # names of the unhashable items, indexed by identity
+        self._names_by_id = {}  # type: Dict[int, str]
+        # optional provider of the items, model to compute the items for, and naming function
+        self.provider = None  # type: Optional[ItemProvider]
+        self.provider_model = None  # type: Any
+        self.provider_key = None  # type: Optional[Callable[[Any], str]]
+        self._items_pending = False
+        # name of the current value, displayed while the items are not loaded
+        self._pending_name = ''
+        # naming function of the items, if any
+        self.key = None  # type: Optional[Callable[[Any], str]]
+        # fingerprints of the items of the native control and of their names
+        self._fingerprint = (get_items_fingerprint([]), get_items_fingerprint([]))
+        # identities of the items of the native control
+        self._native_ids = set()  # type: Set[int]
+
+    def _on_user_change_selection(self, *args):
+        """Invalidate the shadow selection, record the modification, and call the client's callback."""
+        self._selection = _UNKNOWN
+        if self._items_pending and self.get_selection() is self.MORE_ITEMS:
+            # the user requests the items: the value is not modified
+            self.load_items()
+            return
+        self.user_modified = True
+        if self._on_change_selection:
+            self._on_change_selection(*args)
 
     def on_layout(self):
         """Declare the constraints with respect to the owner."""
         self.set_constraint(Widget.RIGHT, self.owner, Widget.RIGHT, -c.RIGHT_MARGIN)
 
-    def set_items(self, items: List[Any], names: Optional[List[str]] = None):
+    def set_items(
+        self,
+        items: List[Any],
+        names: Optional[List[str]] = None,
+        key: Optional[Callable[[Any], str]] = None,
+    ):
         """
         Set the combo box items, with an optional mapping.
 
         This mapping is used to serialize the selected item.
+
+        Parameters
+        ----------
+        items : List[Any]
+            Items of the combo box.
+
+        names : List[str] | None
+            Names of the items, in the same order.
+
+        key : Callable[[Any], str] | None
+            Function returning the name of an item, used when ``names`` is not specified.
         """
-        super().set_items(items)
+        self._items_pending = False
         self.items = items
         self.names = names if names else []
+        self.key = key
+        if not names:
+            names = [key(_) for _ in items] if key else []
+        self._set_native_items(items, names)
+        self._index_items(items, names)
+
+    def add_items(self, items: List[Any], names: Optional[List[str]] = None):
+        """
+        Add items at the end of the combo box, the selection is kept.
+
+        Parameters
+        ----------
+        items : List[Any]
+            Items to add.
+
+        names : List[str] | None
+            Names of the items to add, default the names returned by the naming function
+            of the combo box, if any.
+
+        Raises
+        ------
+        ValueError
+            The names of the existing or added items can't be computed.
+        """
+        self.load_items()
+        key = self.key
+        if names is None and self.names:
+            if key is None:
+                raise ValueError('add_items: the names of the items are required')
+            names = [key(_) for _ in items]
+        if names is not None and self.items and not self.names:
+            if key is None:
+                raise ValueError('add_items: the items of the combo box have no names')
+            self.names = [key(_) for _ in self.items]
+        all_names = self.names + names if names is not None else None
+        self._update_items(self.items + items, all_names)
+
+    def remove_items(self, items: List[Any]):
+        """
+        Remove items from the combo box, the selection is kept if not removed.
+
+        Parameters
+        ----------
+        items : List[Any]
+            Items to remove, compared by identity.
+        """
+        self.load_items()
+        removed = {id(_) for _ in items}
+        kept = [index for index, item in enumerate(self.items) if id(item) not in removed]
+        names = [self.names[_] for _ in kept] if self.names else None
+        self._update_items([self.items[_] for _ in kept], names)
+
+    def _update_items(self, items: List[Any], names: Optional[List[str]]):
+        """Set the items and restore the selection, if still present."""
+        selection = self.get_selection()
+        self.set_items(items, names, self.key)
+        if selection is not None and any(_ is selection for _ in items):
+            self.set_selection(selection)
+
+    def _set_native_items(self, items: List[Any], names: List[str]):
+        """Populate the native control, unless the items and their names are the same."""
+        fingerprint = (get_items_fingerprint(items), get_items_fingerprint(names))
+        if fingerprint != self._fingerprint:
+            _ObjectComboBox.set_items(self, items)
+            self._fingerprint = fingerprint
+            self._native_ids = {id(_) for _ in items}
+            self._selection = _UNKNOWN
+
+    def set_item_provider(
+        self, provider: ItemProvider, model: Any = None, key: Optional[Callable[[Any], str]] = None
+    ):
+        """
+        Set a function computing the items, called only when the items are needed.
+
+        The items are cached per model, so that the subsequent builds
+        of the page do not compute them again. Until the items are needed,
+        the combo box displays only the current value, followed by
+        :attr:`MORE_ITEMS`: selecting this entry populates the combo box.
+
+        Parameters
+        ----------
+        provider : ItemProvider
+            Function computing the items, see :func:`get_provided_items`.
+
+        model : Any
+            Model the items are computed for.
+
+        key : Callable[[Any], str] | None
+            Function returning the name of an item, for serializing the selected item.
+        """
+        self.provider = provider
+        self.provider_model = model
+        self.provider_key = key
+        self._items_pending = True
+        self._pending_name = ''
+
+    def load_items(self):
+        """Populate the combo box with the items of the provider, if not already done."""
+        if self._items_pending:
+            assert self.provider is not None  # nosec B101  # addresses linter
+            items = get_provided_items(self.provider, self.provider_model)
+            self.set_items(items, key=self.provider_key)
+            # select the item corresponding to the displayed value
+            if self._pending_name:
+                self.select_name(self._pending_name)
+
+    def _index_items(self, items: List[Any], names: Iterable[str]):
+        """Build the indexes of the mapping, the first occurrence of an item or name prevails."""
+        self._items_by_name = {}
+        self._names_by_item = {}
+        self._names_by_id = {}
+        for item, name in zip(items, names):
+            self._items_by_name.setdefault(name, item)
+            try:
+                self._names_by_item.setdefault(item, name)
+            except TypeError:
+                # unhashable item
+                self._names_by_id.setdefault(id(item), name)
+
+    def get_item_name(self, item: Any) -> str:
+        """Return the name of an item, or an empty string if the item is unknown."""
+        try:
+            name = self._names_by_item.get(item)
+        except TypeError:
+            # unhashable item
+            name = self._names_by_id.get(id(item))
+        return name if name is not None else ''
 
     def get_selected_name(self) -> str:
         """Return the name of the selected item."""
-        item = self.get_selection()
-        try:
-            name = self.names[self.items.index(item)]
-        except ValueError:
-            name = ''
-        return name
+        if self._items_pending:
+            # the current value is displayed without the items
+            return self._pending_name
+        return self.get_item_name(self.get_selection())
 
     def select_name(self, name: str):
-        """Select the item corresponding to name."""
-        try:
-            item = self.items[self.names.index(name)]
-        except ValueError:
-            item = None
-        self.set_selection(item)
+        """
+        Select the item corresponding to name.
+
+        When the items are computed by a provider, they are not populated until
+        they are needed: the combo box displays only the name.
+        """
+        if self._items_pending:
+            self._pending_name = name
+            items = self._get_pending_items(name)
+            self._set_native_items(items, items)
+            self.set_selection(name if name else None)
+            return
+        self.set_selection(self._items_by_name.get(name))
+
+    def _get_pending_items(self, name: str) -> List[Any]:
+        """Return the items displayed for a value while the items are not loaded."""
+        return [name, self.MORE_ITEMS] if name else [self.MORE_ITEMS]
+
+    def get_selection(self) -> Any:
+        """Return the selected item, or None."""
+        if self._selection is not _UNKNOWN:
+            return self._selection
+        selection = super().get_selection()
+        if self._shadowed:
+            self._selection = selection
+        return selection
+
+    def set_selection(self, item: Any):
+        """Select an item, unless it is already selected."""
+        if self.get_selection() is not item:
+            super().set_selection(item)
+            # the native control selects only its items
+            shadowed = self._shadowed and (item is None or id(item) in self._native_ids)
+            self._selection = item if shadowed else _UNKNOWN
 
 
 class StaticComboBox(ComboBox):
@@ -518,9 +1011,9 @@ class StaticComboBox(ComboBox):
         super().__init__(owner, x + wl, y, w - wl, h, **kwargs)
         self.owner = owner
 
-    def set_visible(self, show: bool):
-        """Show or hide the control."""
-        super().set_visible(show)
+    def apply_visible(self, show: bool):
+        """Show or hide the native controls."""
+        super().apply_visible(show)
         self.label.set_visible(show)
 
 
@@ -576,13 +1069,239 @@ class StaticObjectComboBox(ObjectComboBox):
         super().__init__(owner, x + wl, y, w - wl, h, style=style, **kwargs)
         self.owner = owner
 
-    def set_visible(self, show: bool):
-        """Show or hide the control."""
-        super().set_visible(show)
+    def apply_visible(self, show: bool):
+        """Show or hide the native controls."""
+        super().apply_visible(show)
+        self.label.set_visible(show)
+
+
+class ObjectSelector(ObjectComboBox):
+    """
+    Defines a bundle made of a static, an edit for filtering the items, and an object combo box.
+
+    The combo box contains at most ``max_matches`` items: the ones which name,
+    or a word of the name, starts with the text of the filter. The match is not case sensitive.
+    The items are indexed once by :meth:`set_items`, so that each modification
+    of the filter searches the index instead of all the items.
+
+    Parameters
+    ----------
+    owner : Any
+        Owner of the control.
+
+    text : str
+        Text of the static control.
+
+    wl : int
+        Width of the static control.
+
+    x : int
+        Horizontal position of the control.
+
+    y : int
+        Vertical position of the control.
+
+    w : int
+        Width of the control.
+
+    h : int
+        Height of the control, default csts.COMBO_BOX_HEIGHT.
+
+    wf : int
+        Width of the filter control, default 100.
+
+    max_matches : int
+        Maximum number of items displayed in the combo box, default 100.
+
+    kwargs : Any
+        Other parameters of ``scade.tool.suite.gui.widgets.ObjectComboBox``.
+    """
+
+    # separator between the filter and the combo box controls
+    _SEPARATOR = 5
+
+    def __init__(
+        self,
+        owner,
+        text: str,
+        wl: int,
+        x: int,
+        y: int,
+        w: int,
+        h: int = c.COMBO_BOX_HEIGHT,
+        wf: int = 100,
+        max_matches: int = 100,
+        style: Optional[List[str]] = None,
+        **kwargs,
+    ):
+        """Initialize the object selector with the given parameters."""
+        if not style:
+            style = []
+        if 'dropdownlist' not in style:
+            style.append('dropdownlist')
+        self.label = Label(owner, text, x, y + 4, wl, c.STATIC_HEIGHT)
+        self.filter = EditBox(owner, x + wl, y, wf, c.EDIT_HEIGHT, on_change=self.on_filter_change)
+        offset = wl + wf + self._SEPARATOR
+        super().__init__(owner, x + offset, y, w - offset, h, style=style, **kwargs)
+        self.max_matches = max_matches
+        # sorted lower case words of the names, and the index of the corresponding items
+        self._keys = []  # type: List[str]
+        self._indexes = []  # type: List[int]
+        # fingerprint and names of the indexed items
+        self._indexed = (get_items_fingerprint([]), [])  # type: Tuple[Tuple[int, int], List[str]]
+
+    def set_items(
+        self,
+        items: List[Any],
+        names: Optional[List[str]] = None,
+        key: Optional[Callable[[Any], str]] = None,
+    ):
+        """
+        Set the items of the selector, with an optional mapping.
+
+        The combo box is populated with the items matching the current filter.
+        When neither ``names`` nor ``key`` is specified, the items are filtered
+        with their string representation.
+
+        Parameters
+        ----------
+        items : List[Any]
+            Items of the selector.
+
+        names : List[str] | None
+            Names of the items, in the same order.
+
+        key : Callable[[Any], str] | None
+            Function returning the name of an item, used when ``names`` is not specified.
+        """
+        self._items_pending = False
+        self.items = items
+        self.names = names if names else []
+        self.key = key
+        if not names:
+            names = [key(_) for _ in items] if key else [str(_) for _ in items]
+        indexed = (get_items_fingerprint(items), names)
+        if indexed != self._indexed:
+            # else same items and names, the index is up to date
+            self._indexed = indexed
+            self._index_items(items, names)
+            entries = []
+            for index, name in enumerate(names):
+                name = name.lower()
+                # the name and each word of the name
+                entries.append((name, index))
+                entries.extend((name[m.start() :], index) for m in _WORD_START.finditer(name))
+            entries.sort()
+            self._keys = [_[0] for _ in entries]
+            self._indexes = [_[1] for _ in entries]
+        self.update_matches()
+
+    def match(self, text: str) -> List[Any]:
+        """
+        Return the items matching a filter, limited to ``max_matches``.
+
+        Parameters
+        ----------
+        text : str
+            Filter: beginning of the name, or of a word of the name, of the items.
+
+        Returns
+        -------
+        List[Any]
+            Matching items, sorted by matching word.
+        """
+        prefix = text.lower()
+        matches = []
+        indexes = set()  # type: Set[int]
+        for position in range(bisect_left(self._keys, prefix), len(self._keys)):
+            if len(matches) >= self.max_matches or not self._keys[position].startswith(prefix):
+                break
+            index = self._indexes[position]
+            if index not in indexes:
+                indexes.add(index)
+                matches.append(self.items[index])
+        return matches
+
+    def update_matches(self):
+        """
+        Populate the combo box with the items matching the filter.
+
+        The selection is kept until the user selects another item, even if it does not
+        match the filter: modifying the filter does not modify the bound value.
+        """
+        selection = self.get_selection()
+        if selection is not None and not self._is_item(selection):
+            # obsolete selection, for example after a new set of items
+            selection = None
+        # wrong signature for EditBox.get_name()
+        text: str = self.filter.get_name()  # type: ignore
+        matches = self.match(text)
+        if selection is not None and id(selection) not in set(map(id, matches)):
+            matches = [selection] + matches[: self.max_matches - 1]
+        self._set_displayed_items(matches)
+        self.set_selection(selection)
+
+    def _is_item(self, item: Any) -> bool:
+        """Return whether an object is one of the items of the selector."""
+        try:
+            return item in self._names_by_item
+        except TypeError:
+            # unhashable item
+            return id(item) in self._names_by_id
+
+    def on_filter_change(self, *args):
+        """Update the combo box when the filter is modified."""
+        if self._items_pending:
+            # populated with the items matching the filter
+            self.load_items()
+        else:
+            self.update_matches()
+
+    def load_items(self):
+        """Populate the selector with the items of the provider, if not already done."""
+        if self._items_pending:
+            # the current value is displayed without the items: it is not an item
+            self._set_displayed_items([])
+            super().load_items()
+
+    def _get_pending_items(self, name: str) -> List[Any]:
+        """Return the items displayed for a value while the items are not loaded."""
+        # the items are populated when the filter is modified
+        return [name] if name else []
+
+    def select_name(self, name: str):
+        """
+        Select the item corresponding to name, even if it does not match the filter.
+
+        When the items are computed by a provider, they are not populated until
+        the filter is modified: the combo box displays only the name.
+        """
+        if self._items_pending:
+            super().select_name(name)
+            return
+        item = self._items_by_name.get(name)
+        if item is not None and id(item) not in self._native_ids:
+            matches = self.match(self.filter.get_name())  # type: ignore
+            self._set_displayed_items([item] + matches[: self.max_matches - 1])
+        self.set_selection(item)
+
+    def _set_displayed_items(self, items: List[Any]):
+        """Populate the native combo box."""
+        self._set_native_items(items, [self.get_item_name(_) for _ in items])
+
+    def apply_visible(self, show: bool):
+        """Show or hide the native controls."""
+        super().apply_visible(show)
         self.label.set_visible(show)
+        self.filter.set_visible(show)
 
+    def apply_enable(self, enable: bool):
+        """Enable or disable the native controls."""
+        super().apply_enable(enable)
+        self.filter.set_enable(enable)
 
-class RadioBox(GroupBox):
+
+class RadioBox(ShadowWidget, GroupBox):
     """
     Defines a bundle made of a group and a set of radio button controls.
 
@@ -644,12 +1363,16 @@ class RadioBox(GroupBox):
         self.buttons = {}  # type: Dict[str, RadioButton]
         self.owner = owner
         self.text = text
+        # last known value, unknown until set or read
+        self._value = _UNKNOWN  # type: Any
         # the group is used to set relative constraints
         super().__init__(owner, text, x, y, w, h)
         x = x + offset_x
         y = y + offset_y
         for value, text in buttons:
-            button = RadioButton(owner, text, x, y, wb, c.RADIO_BUTTON_HEIGHT)
+            button = RadioButton(
+                owner, text, x, y, wb, c.RADIO_BUTTON_HEIGHT, on_click=self._on_user_click
+            )
             self.buttons[value] = button
             x += wb
         Widget.group(self.buttons.values())
@@ -674,25 +1397,30 @@ class RadioBox(GroupBox):
             # button.set_constraint(Widget.WIDTH, self, Widget.WIDTH, 0, 1. / count)
             prev = button
 
-    def set_visible(self, show: bool):
-        """Show or hide the control."""
-        super().set_visible(show)
+    def apply_visible(self, show: bool):
+        """Show or hide the native controls."""
+        super().apply_visible(show)
         for button in self.buttons.values():
             button.set_visible(show)
 
-    def set_enable(self, enable: bool):
-        """Enable or disable the control."""
-        super().set_enable(enable)
+    def apply_enable(self, enable: bool):
+        """Enable or disable the native controls."""
+        super().apply_enable(enable)
         for button in self.buttons.values():
             button.set_enable(enable)
 
+    def _on_user_click(self, button: RadioButton):
+        """Invalidate the shadow value."""
+        self._value = _UNKNOWN
+        self.user_modified = True
+
     def get_value(self) -> str:
         """Return the value of the selected button, or ``""`` when none is selected."""
-        for value, button in self.buttons.items():
-            if button.get_check():
-                return value
-        else:
-            return ''
+        if self._value is _UNKNOWN:
+            self._value = next(
+                (value for value, button in self.buttons.items() if button.get_check()), ''
+            )
+        return self._value
 
     def set_value(self, value: str):
         """
@@ -706,15 +1434,17 @@ class RadioBox(GroupBox):
         value : str
             Input value corresponding to a button.
         """
-        if value == '':
-            # uncheck all buttons
-            for button in self.buttons.values():
-                button.set_check(False)
-        else:
-            if value not in self.buttons:
-                value = list(self.buttons.keys())[0]
-            for v, button in self.buttons.items():
-                button.set_check(v == value)
+        if value != '' and value not in self.buttons:
+            value = list(self.buttons.keys())[0]
+        current = self.get_value()
+        if value == current:
+            return
+        # update only the buttons which state changes
+        if current:
+            self.buttons[current].set_check(False)
+        if value:
+            self.buttons[value].set_check(True)
+        self._value = value
 
 
 class GroupRadioBox(RadioBox):
@@ -809,7 +1539,7 @@ class StaticRadioBox(RadioBox):
         self.label = Label(owner, text, x=x, y=y + 4, w=wl, h=c.STATIC_HEIGHT)
         super().__init__(owner, buttons, x + wl, y, w - wl)
 
-    def set_visible(self, show: bool):
-        """Show or hide the control."""
+    def apply_visible(self, show: bool):
+        """Show or hide the native controls."""
         self.label.set_visible(show)
-        super().set_visible(show)
+        super().apply_visible(show)
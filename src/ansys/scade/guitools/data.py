@@ -24,9 +24,11 @@
 
 """Provides extensions for the persistence of settings and properties."""
 
+import json
 from typing import (
     Any,
     Callable,
+    Dict,
     List,  # noqa: F401  # used in a typing annotation
     Optional,
     Tuple,
@@ -44,6 +46,185 @@ Getter = Callable[[], Any]
 """Signature for getting control value."""
 Setter = Callable[[Any], None]
 """Signature for setting control value."""
+AccessorsFactory = Callable[[Any], Tuple[Getter, Setter]]
+"""Signature for returning the get and set accessors of a control."""
+
+
+class VirtualControl:
+    """
+    Control holding a value in memory, for using a data exchange without user interface.
+
+    Setting the value is considered as a modification made by the user.
+
+    Parameters
+    ----------
+    value : Any
+        Initial value of the control.
+    """
+
+    def __init__(self, value: Any = None):
+        """Initialize the virtual control."""
+        self.value = value
+        self.user_modified = False
+
+    def get_value(self) -> Any:
+        """Return the value of the control."""
+        return self.value
+
+    def set_value(self, value: Any):
+        """Set the value of the control."""
+        self.value = value
+        self.user_modified = True
+
+
+# factories of control accessors, indexed by class of controls
+_factories = {
+    EditBox: lambda control: (control.get_name, control.set_name),
+    CheckBox: lambda control: (control.get_check, control.set_check),
+    RadioButton: lambda control: (control.get_check, control.set_check),
+    ComboBox: lambda control: (control.get_name, control.set_name),
+    ListBox: lambda control: (control.get_selection, control.set_selection),
+    ObjectComboBox: lambda control: (control.get_selected_name, control.select_name),
+    RadioBox: lambda control: (control.get_value, control.set_value),
+    VirtualControl: lambda control: (control.get_value, control.set_value),
+    # TODO(Jean Henry): keep or remove logic
+    # https://github.com/ansys/scade-guitools/issues/26
+    # ObjectListBox: lambda control: (control.get_selected_names, control.select_names),
+}  # type: Dict[type, AccessorsFactory]
+# cache of the resolved factories, indexed by class of controls
+_resolved_factories = {}  # type: Dict[type, Optional[AccessorsFactory]]
+
+
+def register_control_accessors(class_: type, factory: AccessorsFactory):
+    """
+    Register the factory of the get and set accessors for a class of controls.
+
+    The factory applies to the derived classes, unless they are registered as well.
+
+    Parameters
+    ----------
+    class_ : type
+        Class of the controls.
+
+    factory : AccessorsFactory
+        Function returning the get and set accessors of a control.
+
+    Examples
+    --------
+
+    .. code-block::
+
+        register_control_accessors(MyControl, lambda c: (c.get_value, c.set_value))
+    """
+    _factories[class_] = factory
+    _resolved_factories.clear()
+
+
+def get_accessors_factory(class_: type) -> Optional[AccessorsFactory]:
+    """
+    Return the factory of the get and set accessors for a class of controls, if any.
+
+    The factory is the one registered for the nearest class in the method resolution order.
+
+    Parameters
+    ----------
+    class_ : type
+        Class of the controls.
+
+    Returns
+    -------
+    Optional[AccessorsFactory]
+    """
+    try:
+        return _resolved_factories[class_]
+    except KeyError:
+        factory = next((_factories[_] for _ in class_.__mro__ if _ in _factories), None)
+        _resolved_factories[class_] = factory
+        return factory
+
+
+class Binding:
+    """
+    Binding of a control to a property, created by :meth:`DataExchange.ddx_control`.
+
+    The data exchange classes complete the binding with the functions
+    accessing the model, resolved once for all from the type of the default value.
+
+    For compatibility, a binding can be unpacked as the tuple
+    ``(get, set, name, default, empty)``.
+
+    Parameters
+    ----------
+    get : Getter
+        Function returning the value of the control.
+
+    set : Setter
+        Function setting the value of the control.
+
+    name : str
+        Name of the property.
+
+    default : Any
+        Default value of the property.
+
+    empty : Any
+        Value to display when it is empty.
+
+    mixed : Any
+        Value to display when the selected models have different values.
+
+    control : Any
+        Control bound to the property, if any.
+    """
+
+    __slots__ = (
+        'get',
+        'set',
+        'name',
+        'default',
+        'empty',
+        'mixed',
+        'control',
+        'read',
+        'write',
+        'convert',
+    )
+
+    def __init__(
+        self,
+        get: Getter,
+        set: Setter,
+        name: str,
+        default: Any,
+        empty: Any,
+        mixed: Any,
+        control: Any = None,
+    ):
+        """Initialize the binding."""
+        self.get = get
+        self.set = set
+        self.name = name
+        self.default = default
+        self.empty = empty
+        self.mixed = mixed
+        self.control = control
+        # accessors to the model, specific to the data exchange classes
+        self.read = None  # type: Optional[Callable[..., Any]]
+        self.write = None  # type: Optional[Callable[..., None]]
+        self.convert = None  # type: Optional[Callable[[Any], Any]]
+
+    def __iter__(self):
+        """Return an iterator on the tuple ``(get, set, name, default, empty)``."""
+        return iter((self.get, self.set, self.name, self.default, self.empty))
+
+    def is_user_modified(self) -> bool:
+        """Return whether the control reports a modification made by the user."""
+        return getattr(self.control, 'user_modified', False)
+
+    def reset_user_modified(self):
+        """Forget the modifications reported by the control, if any."""
+        if self.is_user_modified():
+            self.control.user_modified = False
 
 
 class DataExchange:
@@ -51,15 +232,28 @@ class DataExchange:
 
     def __init__(self):
         """Initialize the data exchange instance."""
-        # get, set, name, default, empty
-        self.properties = []  # type: List[Tuple[Getter, Setter, str, Any, Any]]
+        # bindings, in order of declaration
+        self.properties = []  # type: List[Binding]
+        # bindings indexed by name
+        self.bindings = {}  # type: Dict[str, Binding]
+        # values of the controls after the display of several models, indexed by name
+        self.page_values = {}  # type: Dict[str, Any]
+
+    def reset(self):
+        """
+        Discard the data cached by the previous displays.
+
+        This method is called when the selection changes.
+        """
+        pass
 
     def get_control_accessors(self, control: Widget) -> Tuple[Optional[Getter], Optional[Setter]]:
         """
         Return the get and set accessors for a control, or None if not applicable.
 
-        Override this method in a derived class to define custom
-        implementation for not supported controls.
+        The accessors are provided by the factories registered with
+        :func:`register_control_accessors`. Override this method in a derived class
+        to define custom implementation for not supported controls.
 
         Parameters
         ----------
@@ -70,34 +264,24 @@ class DataExchange:
         -------
         tuple[Getter, Setter]
         """
-        if isinstance(control, EditBox):
-            return (control.get_name, control.set_name)
-        elif isinstance(control, CheckBox):
-            return (control.get_check, control.set_check)
-        elif isinstance(control, RadioButton):
-            return (control.get_check, control.set_check)
-        elif isinstance(control, ComboBox):
-            return (control.get_name, control.set_name)
-        elif isinstance(control, ListBox):
-            return (control.get_selection, control.set_selection)
-        elif isinstance(control, ObjectComboBox):
-            return (control.get_selected_name, control.select_name)
-        elif isinstance(control, RadioBox):
-            return (control.get_value, control.set_value)
-        # TODO(Jean Henry): keep or remove logic
-        # https://github.com/ansys/scade-guitools/issues/26
-        # elif isinstance(control, ObjectListBox):
-        #     return (control.get_selected_names, control.select_names)
-
-        return None, None
-
-    def ddx_control(self, control: Widget, name: str, default: Any, empty: Any = None):
+        factory = get_accessors_factory(type(control))
+        return factory(control) if factory else (None, None)
+
+    def ddx_control(
+        self, control: Widget, name: str, default: Any, empty: Any = None, mixed: Any = None
+    ):
         """
         Declare a property for automatic serialization.
 
         When the page is displayed, the control is updated with the value read from the model.
         When the page is validated, the model is updated with the value read from the control.
 
+        When several models are selected, the control displays either their common value
+        or the ``mixed`` value, and the models are updated only if the control is modified.
+        The control is considered as modified when its value differs from the displayed one,
+        or when it reports a modification made by the user with its attribute
+        ``user_modified``, for example to set the ``mixed`` value to all the models.
+
         Parameters
         ----------
         control : Widget
@@ -112,6 +296,10 @@ class DataExchange:
         empty : Any | None
             Value to display when it is empty, default ``default``.
 
+        mixed : Any | None
+            Value to display when the selected models have different values,
+            default ``""`` for text properties, else ``empty``.
+
         Examples
         --------
 
@@ -132,7 +320,170 @@ class DataExchange:
             assert pfnset is not None  # nosec B101  # addresses linter
             if empty is None:
                 empty = default
-            self.properties.append((pfnget, pfnset, name, default, empty))
+            if mixed is None:
+                mixed = '' if isinstance(default, str) else empty
+            binding = Binding(pfnget, pfnset, name, default, empty, mixed, control)
+            self.compile_binding(binding)
+            self.properties.append(binding)
+            self.bindings[name] = binding
+
+    def ddx_value(
+        self, name: str, default: Any, empty: Any = None, mixed: Any = None
+    ) -> VirtualControl:
+        """
+        Declare a property bound to a value in memory instead of a control.
+
+        This allows running the persistence of a page from a script, without user interface,
+        with the same semantics for the default, empty and mixed values.
+        The parameters are the same as :meth:`ddx_control`.
+
+        When the values are validated without being displayed first, only the properties
+        set by the script are written: the other ones keep their values in the model.
+
+        Returns
+        -------
+        VirtualControl
+            Virtual control holding the value of the property.
+
+        Examples
+        --------
+
+        .. code-block::
+
+            tp = ToolPropDataExchange('MY_TOOL')
+            tp.ddx_value(name='MY_OPTION', default=False)
+            tp.ddx_value(name='MY_PATH', default='')
+            tp.set_values({'MY_OPTION': True})
+            for project in projects:
+                tp.validate(project, configuration)
+        """
+        control = VirtualControl(empty if empty is not None else default)
+        self.ddx_control(control, name, default, empty, mixed)
+        return control
+
+    def get_values(self) -> Dict[str, Any]:
+        """
+        Return the values of the bound controls.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Values of the controls, indexed by name of property.
+        """
+        return {_.name: _.get() for _ in self.properties}
+
+    def set_values(self, values: Dict[str, Any]):
+        """
+        Set the values of the bound controls.
+
+        The properties that are not declared are ignored.
+
+        Parameters
+        ----------
+        values : Dict[str, Any]
+            Values of the controls, indexed by name of property.
+        """
+        for name, value in values.items():
+            binding = self.bindings.get(name)
+            if binding:
+                binding.set(value)
+
+    def compile_binding(self, binding: Binding):
+        """
+        Complete a new binding with the functions accessing the model.
+
+        Override this method in a derived class to resolve once for all
+        the functions used to read or write the property.
+
+        Parameters
+        ----------
+        binding : Binding
+            Binding to complete.
+        """
+        pass
+
+    def get_binding(self, name: str) -> Optional[Binding]:
+        """
+        Return the binding of a property, or None if the property is not declared.
+
+        Parameters
+        ----------
+        name : str
+            Name of the property.
+
+        Returns
+        -------
+        Optional[Binding]
+        """
+        return self.bindings.get(name)
+
+    def is_unset(self, binding: Binding) -> bool:
+        """
+        Return whether a property is bound to a virtual control not set since the last display.
+
+        The values of these properties are not known when the model is validated
+        without being displayed first, for example from a script: they must not be written.
+
+        Parameters
+        ----------
+        binding : Binding
+            Binding of the property.
+
+        Returns
+        -------
+        bool
+        """
+        return isinstance(binding.control, VirtualControl) and not binding.is_user_modified()
+
+    def display_values(self, values: List[Dict[str, Any]]):
+        """
+        Update the controls with the values of the properties of several models.
+
+        Each control is set once, with the value common to all the models,
+        or with its mixed value when the values differ.
+
+        Parameters
+        ----------
+        values : List[Dict[str, Any]]
+            Values of the properties of each model, indexed by name.
+        """
+        self.page_values = {}
+        for binding in self.properties:
+            name = binding.name
+            value = values[0][name] if values else binding.default
+            if any(_[name] != value for _ in values[1:]):
+                value = binding.mixed
+            elif not value and binding.empty:
+                value = binding.empty
+            binding.set(value)
+            binding.reset_user_modified()
+            # the control may adjust the value, for example a radio box
+            self.page_values[name] = binding.get()
+
+    def get_modified_values(self) -> Dict[str, Any]:
+        """
+        Return the values of the controls modified since the last call to ``display_values``.
+
+        A control set by the user to its displayed value, for example the ``mixed`` value,
+        is considered as modified.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Values of the modified properties, indexed by name.
+        """
+        values = {}
+        for binding in self.properties:
+            value = binding.get()
+            name = binding.name
+            if (
+                name in self.page_values
+                and value == self.page_values[name]
+                and not binding.is_user_modified()
+            ):
+                continue
+            values[name] = binding.default if value == binding.empty else value
+        return values
 
 
 class ToolPropDataExchange(DataExchange):
@@ -149,65 +500,375 @@ class ToolPropDataExchange(DataExchange):
     ----------
     tool : str
         Name of the tool to build the project property's name: first token after ``@``.
+
+    snapshot : bool
+        Whether the properties are read at once, with a single traversal
+        of the project's properties, default ``False``.
+        This is more efficient when the page declares many properties.
     """
 
-    def __init__(self, tool: str):
+    def __init__(self, tool: str, snapshot: bool = False):
         """Initialize the tool property data exchange instance."""
         super().__init__()
         self.tool = tool
+        self.snapshot = snapshot
+        # values read from the project by the last display, indexed by name
+        self.displayed_values = {}  # type: Dict[str, Any]
+        # project and configuration of the last display
+        self.displayed_target = None  # type: Optional[Tuple[ProjectEntity, Optional[Configuration]]]
+        # number of properties not written by the last validation, since unchanged
+        self.skipped_writes = 0
+        # models and values read by the last display of several models, indexed by identity
+        self.displayed_models = {}  # type: Dict[int, Tuple[ProjectEntity, Dict[str, Any]]]
+
+    def reset(self):
+        """Discard the values read by the last display."""
+        self.displayed_values = {}
+        self.displayed_target = None
+        self.displayed_models = {}
+
+    def get_tool_props(
+        self, project: ProjectEntity, configuration: Optional[Configuration]
+    ) -> Dict[str, List[str]]:
+        """
+        Return the values of the tool's properties defined for a configuration.
+
+        Parameters
+        ----------
+        project : ProjectEntity
+            Input project or project element.
+
+        configuration : Configuration | None
+            Input configuration, or None for the properties that are not related to a configuration.
+
+        Returns
+        -------
+        Dict[str, List[str]]
+            Values of the properties, indexed by name, without the ``@<TOOL>:`` prefix.
+        """
+        prefix = f'@{self.tool}:'
+        length = len(prefix)
+        return {
+            prop.name[length:]: prop.values
+            for prop in project.props
+            if prop.configuration == configuration and prop.name.startswith(prefix)
+        }
+
+    def compile_binding(self, binding: Binding):
+        """
+        Resolve the project functions for reading or writing the property.
+
+        The functions depend on the type of the default value of the property:
+        ``list``, ``bool``, or scalar otherwise.
+
+        * ``read(project, configuration)`` returns the value of the property.
+        * ``write(project, configuration, value)`` sets the value of the property.
+        * ``convert(values)`` returns the value of the property from its raw values,
+          consistently with ``read``.
+
+        Parameters
+        ----------
+        binding : Binding
+            Binding to complete.
+        """
+        tool = self.tool
+        name = binding.name
+        default = binding.default
+        if isinstance(default, list):
+            binding.read = lambda project, configuration: project.get_tool_prop_def(
+                tool, name, default, configuration
+            )
+            binding.write = lambda project, configuration, value: project.set_tool_prop_def(
+                tool, name, value, default, configuration
+            )
+            binding.convert = lambda values: values
+        elif isinstance(default, bool):
+            binding.read = lambda project, configuration: project.get_bool_tool_prop_def(
+                tool, name, default, configuration
+            )
+            binding.write = lambda project, configuration, value: project.set_bool_tool_prop_def(
+                tool, name, value, default, configuration
+            )
+            binding.convert = lambda values: values[0] == 'true' if values else default
+        else:
+            # assume a scalar value
+            binding.read = lambda project, configuration: project.get_scalar_tool_prop_def(
+                tool, name, default, configuration
+            )
+            binding.write = lambda project, configuration, value: (
+                project.set_scalar_tool_prop_def(tool, name, value, default, configuration)
+            )
+            binding.convert = lambda values: values[0] if values else default
+
+    def read_values(
+        self, project: ProjectEntity, configuration: Optional[Configuration]
+    ) -> Dict[str, Any]:
+        """
+        Return the values of the properties read from the model.
+
+        Parameters
+        ----------
+        project : ProjectEntity
+            Input project or project element.
+
+        configuration : Configuration | None
+            Input configuration, or None for the properties that are not related to a configuration.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Values of the properties, indexed by name.
+        """
+        if self.snapshot:
+            props = self.get_tool_props(project, configuration)
+            return {
+                _.name: _.convert(props[_.name]) if _.name in props else _.default  # type: ignore
+                for _ in self.properties
+            }
+        return {_.name: _.read(project, configuration) for _ in self.properties}  # type: ignore
+
+    def read_configurations(
+        self, project: Project, configurations: Optional[List[Configuration]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the values of the properties for several configurations.
+
+        The project's properties are traversed only once.
+
+        Parameters
+        ----------
+        project : Project
+            Input project.
+
+        configurations : List[Configuration] | None
+            Input configurations, default all the configurations of the project.
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            Values of the properties, indexed by name of configuration and name of property.
+        """
+        if configurations is None:
+            configurations = project.configurations
+        prefix = f'@{self.tool}:'
+        length = len(prefix)
+        props = {_.name: {} for _ in configurations}  # type: Dict[str, Dict[str, List[str]]]
+        for prop in project.props:
+            if prop.configuration is None or not prop.name.startswith(prefix):
+                continue
+            configuration_props = props.get(prop.configuration.name)
+            if configuration_props is not None:
+                configuration_props[prop.name[length:]] = prop.values
+        return {
+            configuration: {
+                _.name: _.convert(values[_.name]) if _.name in values else _.default  # type: ignore
+                for _ in self.properties
+            }
+            for configuration, values in props.items()
+        }
+
+    def write_configurations(self, project: Project, changes: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Apply a set of changes to several configurations.
+
+        The properties are written only when their values differ from the ones of the project.
+        The properties or configurations that do not exist are ignored.
+
+        Parameters
+        ----------
+        project : Project
+            Input project.
+
+        changes : Dict[str, Dict[str, Any]]
+            Values of the properties, indexed by name of configuration and name of property.
+
+        Returns
+        -------
+        int
+            Number of properties written.
+
+        Examples
+        --------
+
+        .. code-block::
+
+            # align an option on all the configurations
+            matrix = tp.read_configurations(project)
+            tp.write_configurations(project, {_: {'MY_OPTION': True} for _ in matrix})
+        """
+        configurations = [_ for _ in project.configurations if _.name in changes]
+        matrix = self.read_configurations(project, configurations)
+        writes = 0
+        for configuration in configurations:
+            values = matrix[configuration.name]
+            for name, value in changes[configuration.name].items():
+                binding = self.bindings.get(name)
+                if binding is None or values[name] == value:
+                    continue
+                binding.write(project, configuration, value)  # type: ignore
+                writes += 1
+        return writes
 
     def display(self, project: Project, configuration: Optional[Configuration]):
         """Update the page with the properties read from the model."""
-        for _, pfnset, name, default, empty in self.properties:
-            if isinstance(default, list):
-                value = project.get_tool_prop_def(self.tool, name, default, configuration)
-            elif isinstance(default, bool):
-                value = project.get_bool_tool_prop_def(self.tool, name, default, configuration)
-            else:
-                # assume a scalar value
-                value = project.get_scalar_tool_prop_def(self.tool, name, default, configuration)
-            if not value and empty:
-                value = empty
-            pfnset(value)
-
-    def validate(self, project: Project, configuration: Optional[Configuration]):
-        """Update the model with the properties read from the page."""
-        for pfnget, _, name, default, empty in self.properties:
-            value = pfnget()
-            if value == empty:
-                value = default
-            if isinstance(default, list):
-                project.set_tool_prop_def(self.tool, name, value, default, configuration)
-            elif isinstance(value, bool):
-                project.set_bool_tool_prop_def(self.tool, name, value, default, configuration)
-            else:
-                # assume a scalar value
-                project.set_scalar_tool_prop_def(self.tool, name, value, default, configuration)
+        self.displayed_values = self.read_values(project, configuration)
+        self.displayed_target = (project, configuration)
+        for binding in self.properties:
+            value = self.displayed_values[binding.name]
+            if not value and binding.empty:
+                value = binding.empty
+            binding.set(value)
+            binding.reset_user_modified()
+
+    def validate(self, project: Project, configuration: Optional[Configuration]) -> int:
+        """
+        Update the model with the properties read from the page.
+
+        The properties are not written when their values are the ones
+        read by the last display of the same project and configuration.
+        When the project and configuration are not the displayed ones,
+        the properties bound to virtual controls are written only when set.
+
+        Returns
+        -------
+        int
+            Number of properties not written since unchanged,
+            also available in the attribute ``skipped_writes``.
+        """
+        target = self.displayed_target
+        same_target = target is not None and target[0] is project and target[1] is configuration
+        displayed_values = self.displayed_values if same_target else {}
+        self.skipped_writes = 0
+        for binding in self.properties:
+            value = binding.get()
+            if value == binding.empty:
+                value = binding.default
+            name = binding.name
+            if name in displayed_values and displayed_values[name] == value:
+                self.skipped_writes += 1
+                continue
+            if not same_target and self.is_unset(binding):
+                # not displayed: the value of the property is not known
+                self.skipped_writes += 1
+                continue
+            # the project is now up to date
+            displayed_values[name] = value
+            binding.write(project, configuration, value)  # type: ignore
+        return self.skipped_writes
+
+    def display_models(
+        self, projects: List[ProjectEntity], configuration: Optional[Configuration] = None
+    ):
+        """
+        Update the page with the properties read from several models.
+
+        Parameters
+        ----------
+        projects : List[ProjectEntity]
+            Input projects or project elements.
+
+        configuration : Configuration | None
+            Input configuration, or None for the properties that are not related to a configuration.
+        """
+        self.displayed_models = {}
+        values = []
+        for project in projects:
+            project_values = self.read_values(project, configuration)
+            self.displayed_models[id(project)] = (project, project_values)
+            values.append(project_values)
+        self.display_values(values)
+
+    def validate_models(
+        self, projects: List[ProjectEntity], configuration: Optional[Configuration] = None
+    ):
+        """
+        Update several models with the properties modified in the page.
+
+        Parameters
+        ----------
+        projects : List[ProjectEntity]
+            Input projects or project elements.
+
+        configuration : Configuration | None
+            Input configuration, or None for the properties that are not related to a configuration.
+        """
+        modified = self.get_modified_values()
+        for project in projects:
+            _, displayed_values = self.displayed_models.get(id(project), (None, {}))
+            for name, value in modified.items():
+                if name in displayed_values and displayed_values[name] == value:
+                    continue
+                displayed_values[name] = value
+                self.bindings[name].write(project, configuration, value)  # type: ignore
 
 
 class SettingsDataExchange(ISettingsDataExchange, ToolPropDataExchange):
-    """Default implementation to manage the persistence of most usual controls in the project."""
+    """
+    Default implementation to manage the persistence of most usual controls in the project.
 
-    def __init__(self, tool: str):
+    The values of the properties are cached for each configuration, so that switching
+    between configurations in the settings dialog does not read the project again.
+    Only the properties modified in the page are written to the project.
+    """
+
+    def __init__(self, tool: str, snapshot: bool = False):
         """Initialize the settings data exchange instance."""
-        super().__init__(tool)
+        super().__init__(tool, snapshot)
         # super(IPropertiesDataExchange, self).__init__(self, tool)
+        # project, configuration, and values of the properties, loaded or edited,
+        # indexed by identity of the project and configuration
+        self.cached_values = {}  # type: Dict[Tuple[int, int], Tuple[ProjectEntity, Optional[Configuration], Dict[str, Any]]]
+
+    def reset(self):
+        """Discard the values cached for each configuration."""
+        super().reset()
+        self.cached_values = {}
+
+    def read_values(
+        self, project: ProjectEntity, configuration: Optional[Configuration]
+    ) -> Dict[str, Any]:
+        """
+        Return the values of the properties, read from the model the first time only.
+
+        The returned dictionary is the cached one: it is kept up to date by
+        :meth:`validate <ToolPropDataExchange.validate>`.
+        """
+        values = self.get_cached_values(project, configuration)
+        if values is None:
+            values = super().read_values(project, configuration)
+            # keep references to the objects so that their identities are not reused
+            self.cached_values[(id(project), id(configuration))] = (project, configuration, values)
+        return values
+
+    def get_cached_values(
+        self, project: ProjectEntity, configuration: Optional[Configuration]
+    ) -> Optional[Dict[str, Any]]:
+        """Return the values cached for a project and a configuration, or None."""
+        _, _, values = self.cached_values.get(
+            (id(project), id(configuration)), (project, configuration, None)
+        )
+        return values
 
     def model_to_page(self, project: Project, configuration: Configuration):
-        """Update the page with the properties read from the model."""
+        """Update the page with the properties read from the model or the cache."""
         self.display(project, configuration)
 
     def page_to_model(self, project: Project, configuration: Configuration):
-        """Update the model with the properties read from the page."""
+        """Update the model with the properties modified in the page."""
+        values = self.get_cached_values(project, configuration)
+        if values is not None:
+            # the cached values are the ones of the project
+            self.displayed_values = values
+            self.displayed_target = (project, configuration)
         self.validate(project, configuration)
 
 
 class ProjectPropertiesDataExchange(IPropertiesDataExchange, ToolPropDataExchange):
     """Default implementation to manage the persistence of most usual controls in the project."""
 
-    def __init__(self, tool: str):
+    def __init__(self, tool: str, snapshot: bool = False):
         """Initialize the project properties data exchange instance."""
-        super().__init__(tool)
+        super().__init__(tool, snapshot)
         # super(IPropertiesDataExchange, self).__init__(self, tool)
 
     def model_to_page(self, model: ProjectEntity):
@@ -218,6 +879,20 @@ class ProjectPropertiesDataExchange(IPropertiesDataExchange, ToolPropDataExchang
         """Update the model with the properties read from the page."""
         self.validate(model, None)
 
+    def models_to_page(self, models: List[ProjectEntity]):
+        """Update the page with the properties read from the models."""
+        if len(models) > 1:
+            self.display_models(models)
+        else:
+            super().models_to_page(models)
+
+    def page_to_models(self, models: List[ProjectEntity]):
+        """Update the models with the properties read from the page."""
+        if len(models) > 1:
+            self.validate_models(models)
+        else:
+            super().page_to_models(models)
+
 
 class PragmaDataExchange(DataExchange):
     """
@@ -236,31 +911,152 @@ class PragmaDataExchange(DataExchange):
         """Initialize the pragma data exchange instance."""
         super().__init__()
         self.id = id
+        # objects and data read by the displays, indexed by identity of the objects
+        self.displayed_data = {}  # type: Dict[int, Tuple[suite.Annotable, dict]]
+
+    def reset(self):
+        """Discard the data read by the previous displays."""
+        self.displayed_data = {}
 
     def display(self, object_: suite.Annotable):
         """Update the page with the properties read from the model."""
-        data = get_pragma_json(object_, self.id)
+        self.display_data(object_, get_pragma_json(object_, self.id))
+
+    def display_data(self, object_: suite.Annotable, data: Any):
+        """
+        Update the page with the data of the pragma read from the model.
+
+        Parameters
+        ----------
+        object_ : suite.Annotable
+            Model element the data is read from.
+
+        data : Any
+            Decoded json data of the pragma, None in case of syntax error.
+        """
         if data is None:
             # defensive programming, json syntax error error not expected
             # assert False
             return
         assert isinstance(data, dict)  # nosec B101  # addresses linter
-        for _, pfnset, name, default, empty in self.properties:
-            value = data.get(name, default)
-            if not value and empty:
-                value = empty
-            pfnset(value)
+        values = self.record_data(object_, data)
+        for binding in self.properties:
+            value = values[binding.name]
+            if not value and binding.empty:
+                value = binding.empty
+            binding.set(value)
+            binding.reset_user_modified()
 
-    def validate(self, object_: suite.Annotable):
-        """Update the model with the properties read from the page."""
+    def record_data(self, object_: suite.Annotable, data: dict) -> Dict[str, Any]:
+        """
+        Record the data of the pragma read from a model element.
+
+        Parameters
+        ----------
+        object_ : suite.Annotable
+            Model element the data is read from.
+
+        data : dict
+            Decoded json data of the pragma.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Values of the properties, indexed by name.
+        """
+        self.displayed_data[id(object_)] = (object_, data)
+        return {_.name: data.get(_.name, _.default) for _ in self.properties}
+
+    def get_page_data(self) -> dict:
+        """Return the data of the pragma built from the values of the controls."""
         data = {}
-        for pfnget, _, name, default, empty in self.properties:
-            value = pfnget()
-            if value == empty:
-                value = default
-            if value != default:
-                data[name] = value
+        for binding in self.properties:
+            value = binding.get()
+            if value == binding.empty:
+                value = binding.default
+            if value != binding.default:
+                data[binding.name] = value
+        return data
+
+    def is_modified(self, object_: suite.Annotable, data: dict) -> bool:
+        """Return whether the data differs from the one read by the last display of the object."""
+        _, displayed_data = self.displayed_data.get(id(object_), (None, None))
+        return data != displayed_data
+
+    def validate(self, object_: suite.Annotable):
+        """
+        Update the model with the properties read from the page.
+
+        The pragma is not written when its data is the one read by the last display of the object.
+        The properties bound to virtual controls not set since the last display keep
+        their values, read from the model when the object is not displayed.
+        """
+        data = self.get_page_data()
+        unset = [_.name for _ in self.properties if self.is_unset(_)]
+        if unset:
+            # keep the values of the properties not set, read from the model if not displayed
+            _, model_data = self.displayed_data.get(id(object_), (None, None))
+            if model_data is None:
+                model_data = get_pragma_json(object_, self.id)
+                if not isinstance(model_data, dict):
+                    # json syntax error: the values of the properties are not known
+                    return
+                self.displayed_data[id(object_)] = (object_, model_data)
+            for name in unset:
+                data.pop(name, None)
+                if name in model_data:
+                    data[name] = model_data[name]
+        if not self.is_modified(object_, data):
+            return
         set_pragma_json(object_, self.id, data)
+        # the model is now up to date
+        self.displayed_data[id(object_)] = (object_, data)
+
+    def display_models(self, objects: List[suite.Annotable]):
+        """
+        Update the page with the properties read from several model elements.
+
+        Parameters
+        ----------
+        objects : List[suite.Annotable]
+            Input model elements.
+        """
+        values = []
+        for object_ in objects:
+            data = get_pragma_json(object_, self.id)
+            if isinstance(data, dict):
+                values.append(self.record_data(object_, data))
+        self.display_values(values)
+
+    def validate_models(self, objects: List[suite.Annotable]):
+        """
+        Update several model elements with the properties modified in the page.
+
+        The other properties of the model elements are left unchanged.
+
+        Parameters
+        ----------
+        objects : List[suite.Annotable]
+            Input model elements.
+        """
+        modified = self.get_modified_values()
+        if not modified:
+            return
+        for object_ in objects:
+            _, displayed_data = self.displayed_data.get(id(object_), (None, None))
+            if displayed_data is None:
+                # not displayed, for example because of a json syntax error
+                continue
+            data = dict(displayed_data)
+            for name, value in modified.items():
+                if value != self.bindings[name].default:
+                    data[name] = value
+                else:
+                    data.pop(name, None)
+            if data != displayed_data:
+                set_pragma_json(object_, self.id, data)
+                # the model is now up to date
+                self.displayed_data[id(object_)] = (object_, data)
 
 
 class ScadePropertiesDataExchange(IPropertiesDataExchange, PragmaDataExchange):
@@ -278,3 +1074,172 @@ class ScadePropertiesDataExchange(IPropertiesDataExchange, PragmaDataExchange):
     def page_to_model(self, object_: suite.Annotable):
         """Update the model element with the properties read from the page."""
         self.validate(object_)
+
+    def models_to_page(self, models: List[suite.Annotable]):
+        """Update the page with the properties read from the model elements."""
+        if len(models) > 1:
+            self.display_models(models)
+        else:
+            super().models_to_page(models)
+
+    def page_to_models(self, models: List[suite.Annotable]):
+        """Update the model elements with the properties read from the page."""
+        if len(models) > 1:
+            self.validate_models(models)
+        else:
+            super().page_to_models(models)
+
+
+class CompositePragmaDataExchange:
+    """
+    Means to serialize values as several SCADE Suite pragmas of a same model element.
+
+    The pragmas are read with a single traversal of the pragmas of the model element,
+    and only the modified ones are written.
+
+    Each pragma is managed by an instance of :class:`PragmaDataExchange`,
+    created with :meth:`add_pragma`, for declaring the properties.
+
+    Examples
+    --------
+
+    .. code-block::
+
+        # on_build_ex method of a page
+        self.pdx = ScadeCompositePropertiesDataExchange()
+        ...
+        edit = self.add_edit(y)
+        self.pdx.add_pragma('my_tool').ddx_control(edit, name='MY_PROP', default='')
+        y += csts.DY
+        cb = self.add_check_button(y, 'Option')
+        self.pdx.add_pragma('my_other_tool').ddx_control(cb, name='MY_OPTION', default=False)
+        y += csts.DY
+    """
+
+    def __init__(self):
+        """Initialize the composite pragma data exchange instance."""
+        self.exchanges = {}  # type: Dict[str, PragmaDataExchange]
+
+    def add_pragma(self, id: str) -> PragmaDataExchange:
+        """
+        Return the data exchange instance for a pragma, created if needed.
+
+        Parameters
+        ----------
+        id : str
+            Identifier of the pragma.
+
+        Returns
+        -------
+        PragmaDataExchange
+        """
+        exchange = self.exchanges.get(id)
+        if exchange is None:
+            exchange = PragmaDataExchange(id)
+            self.exchanges[id] = exchange
+        return exchange
+
+    def reset(self):
+        """Discard the data read by the previous displays."""
+        for exchange in self.exchanges.values():
+            exchange.reset()
+
+    def get_pragmas_json(self, object_: suite.Annotable) -> Dict[str, Any]:
+        """
+        Return the decoded json data of the managed pragmas, with a single traversal.
+
+        The data of a pragma is ``{}`` when the pragma is not defined,
+        and None in case of syntax error.
+
+        Parameters
+        ----------
+        object_ : suite.Annotable
+            Input model element.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Data of the pragmas, indexed by identifier.
+        """
+        texts = {}
+        for pragma in object_.pragmas:
+            if isinstance(pragma, suite.TextPragma) and pragma.id in self.exchanges:
+                # consider the first pragma, as get_pragma_json does
+                texts.setdefault(pragma.id, pragma.text)
+        pragmas = {}
+        for id in self.exchanges:
+            text = texts.get(id)
+            try:
+                pragmas[id] = json.loads(text) if text else {}
+            except json.JSONDecodeError:
+                pragmas[id] = None
+        return pragmas
+
+    def display(self, object_: suite.Annotable):
+        """Update the page with the properties read from the model."""
+        for id, data in self.get_pragmas_json(object_).items():
+            self.exchanges[id].display_data(object_, data)
+
+    def validate(self, object_: suite.Annotable):
+        """Update the model with the properties read from the page, for the modified pragmas."""
+        for exchange in self.exchanges.values():
+            exchange.validate(object_)
+
+    def display_models(self, objects: List[suite.Annotable]):
+        """
+        Update the page with the properties read from several model elements.
+
+        Parameters
+        ----------
+        objects : List[suite.Annotable]
+            Input model elements.
+        """
+        values = {id: [] for id in self.exchanges}  # type: Dict[str, List[Dict[str, Any]]]
+        for object_ in objects:
+            for id, data in self.get_pragmas_json(object_).items():
+                if isinstance(data, dict):
+                    values[id].append(self.exchanges[id].record_data(object_, data))
+        for id, exchange in self.exchanges.items():
+            exchange.display_values(values[id])
+
+    def validate_models(self, objects: List[suite.Annotable]):
+        """
+        Update several model elements with the properties modified in the page.
+
+        Parameters
+        ----------
+        objects : List[suite.Annotable]
+            Input model elements.
+        """
+        for exchange in self.exchanges.values():
+            exchange.validate_models(objects)
+
+
+class ScadeCompositePropertiesDataExchange(IPropertiesDataExchange, CompositePragmaDataExchange):
+    """Default implementation to manage the persistence of controls in several pragmas."""
+
+    def __init__(self):
+        """Initialize the SCADE composite properties data exchange instance."""
+        super().__init__()
+
+    def model_to_page(self, object_: suite.Annotable):
+        """Update the page with the properties read from the model element."""
+        self.display(object_)
+
+    def page_to_model(self, object_: suite.Annotable):
+        """Update the model element with the properties read from the page."""
+        self.validate(object_)
+
+    def models_to_page(self, models: List[suite.Annotable]):
+        """Update the page with the properties read from the model elements."""
+        if len(models) > 1:
+            self.display_models(models)
+        else:
+            super().models_to_page(models)
+
+    def page_to_models(self, models: List[suite.Annotable]):
+        """Update the model elements with the properties read from the page."""
+        if len(models) > 1:
+            self.validate_models(models)
+        else:
+            super().page_to_models(models)
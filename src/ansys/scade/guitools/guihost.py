@@ -24,225 +24,77 @@
 
 """Provides access to GUI server for property pages."""
 
+import atexit
+import os
+from pathlib import Path
 import traceback
-from typing import Any, Dict, List
 
 import scade
+from scade.tool.suite.gui import register_unload_model_callable  # type: ignore
 
 from ansys.scade.apitools.info import get_scade_version
-from ansys.scade.guitools import __version__, importlib_metadata
-from ansys.scade.guitools.control import ComboBox
-import ansys.scade.guitools.csts as c
-from ansys.scade.guitools.interfaces import IGuiHostClient
-from ansys.scade.guitools.page import PropertyPageEx
+from ansys.scade.guitools import __version__
+from ansys.scade.guitools.control import clear_provided_items
+
+# classes and functions implemented in a separate module, for testing purposes
+from ansys.scade.guitools.host import (  # noqa: F401
+    ClientTimings,
+    HostPage,
+    ProxyPageClient,
+    load_class,
+    load_descriptions,
+    scan_descriptions,
+)
 
 _pages = {}
 
 
-class ProxyPageClient:
+def log_timings():
     """
-    Maintains a reference to a client page and the name of its category.
+    Display the statistics of the calls to the client pages in the ``LOG`` tab.
 
-    Parameters
-    ----------
-    category : str
-        Name of the page.
-
-    client : IGuiHostClient
-        Instance of the hosted page.
+    The statistics are available when the environment variable
+    ``ANSYS_SCADE_GUIHOST_TIMINGS`` is defined when SCADE starts.
     """
+    if HostPage.timings is None:
+        scade.tabput('LOG', 'GUI Host timings are not enabled\n')  # type: ignore
+    else:
+        HostPage.timings.log()
 
-    def __init__(self, category: str, client: IGuiHostClient):
-        """Initialize the proxy with a category and a client."""
-        self.category = category
-        self.client = client
-
-
-class HostPage(PropertyPageEx):
-    """
-    Defines a property page for hosting client pages.
-
-    Parameters
-    ----------
-    name : str
-        Name of the property Page.
-
-    optional : bool
-        Whether the combo box for selecting clients is hidden
-        when there is only one client.
-
-    args : Any
-        Additional parameters for the property page.
-
-    kwargs : Any
-        Additional parameters for the property page.
-    """
-
-    def __init__(self, name: str, optional: bool, *args, **kwargs):
-        """Initialize the host page."""
-        super().__init__(50, name=name, *args, **kwargs)
-        self.optional = optional
-
-        # registered clients
-        self.proxies: List[ProxyPageClient] = []
-        # active clients for the current selection, indexed by category
-        self.active_clients: Dict[str, ProxyPageClient] = {}
-        # active categories (sorted)
-        self.categories: List[str] = []
-        # current selected category
-        self.category = ''
-        # controls
-        self.cb_clients = None
-
-    def add_client(self, proxy: ProxyPageClient):
-        """
-        Add a client to the page.
-
-        Parameters
-        ----------
-        proxy : ProxyPageClient
-            Client page proxy.
-        """
-        self.proxies.append(proxy)
 
-    def is_available(self, models: List[Any]) -> bool:
-        """
-        Return whether the page is available for the current selection.
+def _save_timings(path: Path):
+    """Save the statistics of the calls to the client pages, when SCADE terminates."""
+    assert HostPage.timings is not None  # nosec B101  # addresses linter
+    try:
+        HostPage.timings.save(path)
+    except OSError:
+        pass
 
-        The page is available for the selected models
-        if at least one of its clients is available
 
-        Parameters
-        ----------
-        models : List[Any]
-            List of selected objects in the IDE.
-        """
-        self.active_clients = {}
-        self.categories = []
-        for proxy in sorted(self.proxies, key=lambda p: p.category):
-            if proxy.client.is_available(models):
-                self.active_clients[proxy.category] = proxy
-                self.categories.append(proxy.category)
-        return len(self.categories) > 0
-
-    def on_context(self, models: List[Any]):
-        """
-        Declare the models the page should consider.
-
-        Parameters
-        ----------
-        models : List[Any]
-            List of selected objects in the IDE.
-        """
-        if not models:
-            # deactivate the clients
-            for proxy in self.active_clients.values():
-                proxy.client.set_models(models)
-            self.active_clients = {}
-        else:
-            # called between is_available and on_display,
-            # seems redundant with is_available
-            for proxy in self.active_clients.values():
-                if not proxy.client.is_available(models):
-                    if not models:
-                        continue
-                # assert proxy.client.is_available(models)
-                proxy.client.set_models(models)
-
-    def on_build(self):
-        """Build the property page and its clients."""
-        # alignment for the first line
-        y = c.TOP_MARGIN
-        self.cb_clients = self.add_static_combo_box(
-            y, '&Tool:', style=['dropdownlist'], on_change_selection=self.on_sel_change
-        )
-        self.cb_clients.set_items(self.categories)
-        if len(self.active_clients) > 1:
-            y += c.DY
-        else:
-            if self.optional:
-                self.cb_clients.set_visible(False)
-            else:
-                self.cb_clients.set_enable(False)
-                y += c.DY
-        for proxy in self.active_clients.values():
-            proxy.client.on_build(self, y)
-
-    def on_display(self):
-        """
-        Display the property page and its clients.
-
-        Activate the last active client when possible.
-        """
-        assert self.cb_clients is not None  # nosec B101  # addresses linter
-        selected_proxy = self.active_clients.get(self.category)
-        if not selected_proxy:
-            self.category = self.categories[0]
-            selected_proxy = self.active_clients.get(self.category)
-        self.cb_clients.set_selection(self.category)
-        for proxy in self.active_clients.values():
-            proxy.client.on_display()
-            proxy.client.show(proxy == selected_proxy)
-
-    def on_validate(self):
-        """Validate the property page's clients."""
-        for proxy in self.active_clients.values():
-            proxy.client.on_validate()
-
-    def on_close(self):
-        """Perform any cleaning before the page is closed."""
-        for proxy in self.active_clients.values():
-            proxy.client.on_close()
-
-    def on_layout(self):
-        """Declare the contained control's constraints."""
-        assert self.cb_clients is not None  # nosec B101  # addresses linter
-        self.cb_clients.on_layout()
-        for proxy in self.active_clients.values():
-            proxy.client.on_layout()
-
-    def on_sel_change(self, combobox: ComboBox, index: int):
-        """
-        Display the selected client.
-
-        Parameters
-        ----------
-        combobox : ComboBox
-            Control initiating the notification. Unused.
-
-        index : int
-            Index of the selected element.
-        """
-        new_category = self.categories[index]
-        if new_category != self.category:
-            self.active_clients[self.category].client.show(False)
-            self.category = new_category
-            self.active_clients[self.category].client.show(True)
+def _on_unload_model(*args):
+    """Discard the items cached by the combo boxes, which may reference the unloaded model."""
+    clear_provided_items()
 
 
 def main():
     """Create the server property pages from the installed clients."""
     global _pages
 
+    # opt-in statistics: the value of the variable is either
+    # 1 or the path of a JSON file to save the statistics when SCADE terminates
+    timings = os.environ.get('ANSYS_SCADE_GUIHOST_TIMINGS')
+    if timings:
+        HostPage.timings = ClientTimings()
+        if timings != '1':
+            atexit.register(_save_timings, Path(timings))
+    # opt-in coalescing of the contexts of the displayed selection
+    HostPage.coalesce = os.environ.get('ANSYS_SCADE_GUIHOST_COALESCE', '0') not in {'', '0'}
+    register_unload_model_callable(_on_unload_model)
+
     # get the current version and convert it to the format of srg files
     std_version = get_scade_version() * 100
 
-    # load the page descriptions from the registered entry points
-    group = 'ansys.scade.guihost'
-    descriptions = sum(
-        [_.load()() for _ in importlib_metadata.entry_points(group=group) if _.name == 'pages'], []
-    )
-
-    for description in descriptions:
-        version = description.get('version', 0)
-        expire = description.get('expire', 9999999)
-        if version > std_version or expire <= std_version:
-            continue
-        # deprecated
-        if not description.get('activate', True):
-            continue
-        if not description.get('active', True):
-            continue
+    for description in load_descriptions(std_version):
         tab = description['page']
         category = description['category']
         class_ = description['class']
@@ -254,9 +106,8 @@ def main():
         if not page:
             page = HostPage(tab, optional)
             _pages[tab] = page
-        # create the instance of the hosted page
-        cls = class_()
-        page.add_client(ProxyPageClient(category, cls))
+        # the instance of the hosted page is created on demand
+        page.add_client(ProxyPageClient(category, class_, description.get('types')))
 
 
 # scade is a CPython module defined dynamically
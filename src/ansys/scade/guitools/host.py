@@ -0,0 +1,793 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2024 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Provides the implementation of the GUI host, independent of its registration in SCADE.
+
+The module :mod:`guihost <ansys.scade.guitools.guihost>` creates the pages when it is loaded.
+"""
+
+from collections import deque
+from contextlib import contextmanager
+import importlib
+import json
+import os
+from pathlib import Path
+import sys
+import time
+import traceback
+from typing import Any, Deque, Dict, Iterator, List, Optional, Set, Tuple, Type, Union
+
+import scade
+
+from ansys.scade.guitools import __version__, importlib_metadata
+from ansys.scade.guitools.control import ComboBox
+import ansys.scade.guitools.csts as c
+from ansys.scade.guitools.interfaces import IGuiHostClient
+from ansys.scade.guitools.page import (
+    PropertyPageEx,
+    SelectionContext,  # noqa: F401  # used in a typing annotation
+    get_selection_context,
+    reset_selection_context,
+)
+
+
+def load_class(path: str) -> type:
+    """
+    Return the class designated by a path.
+
+    The path is either ``<module>:<class>``, as for entry points,
+    or ``<module>.<class>``. The module is imported when not already loaded.
+
+    Parameters
+    ----------
+    path : str
+        Path of the class.
+
+    Returns
+    -------
+    type
+    """
+    if ':' in path:
+        module_name, class_name = path.split(':', 1)
+    else:
+        module_name, _, class_name = path.rpartition('.')
+    object_ = importlib.import_module(module_name)
+    # support nested classes
+    for name in class_name.split('.'):
+        object_ = getattr(object_, name)
+    return object_  # type: ignore
+
+
+class ClientTimings:
+    """
+    Maintains statistics of the durations of the calls to the client pages.
+
+    The statistics are indexed by page, category, and method.
+    The percentiles are computed from the last ``size`` durations.
+
+    Parameters
+    ----------
+    size : int
+        Number of durations considered for the percentiles, default 1000.
+    """
+
+    def __init__(self, size: int = 1000):
+        """Initialize the statistics."""
+        self.size = size
+        # count, total, and max, indexed by page, category, and method
+        self.totals: Dict[Tuple[str, str, str], List[float]] = {}
+        # last durations, indexed by page, category, and method
+        self.durations: Dict[Tuple[str, str, str], Deque[float]] = {}
+
+    def record(self, tab: str, category: str, method: str, duration: float):
+        """
+        Record the duration of a call.
+
+        Parameters
+        ----------
+        tab : str
+            Name of the hosting page.
+
+        category : str
+            Category of the client page.
+
+        method : str
+            Name of the called method.
+
+        duration : float
+            Duration of the call, in seconds.
+        """
+        key = (tab, category, method)
+        totals = self.totals.get(key)
+        if totals is None:
+            self.totals[key] = [1, duration, duration]
+            self.durations[key] = deque([duration], maxlen=self.size)
+        else:
+            totals[0] += 1
+            totals[1] += duration
+            totals[2] = max(totals[2], duration)
+            self.durations[key].append(duration)
+
+    def get_statistics(self) -> List[Dict[str, Any]]:
+        """
+        Return the statistics, sorted by decreasing total duration.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Page, category, method, count, total, p50, p95, and max of the calls.
+            The durations are expressed in milliseconds.
+        """
+        statistics = []
+        for key, (count, total, max_) in self.totals.items():
+            durations = sorted(self.durations[key])
+            n = len(durations)
+            statistics.append(
+                {
+                    'page': key[0],
+                    'category': key[1],
+                    'method': key[2],
+                    'count': int(count),
+                    'total': total * 1000,
+                    'p50': durations[int(0.5 * (n - 1))] * 1000,
+                    'p95': durations[int(0.95 * (n - 1))] * 1000,
+                    'max': max_ * 1000,
+                }
+            )
+        return sorted(statistics, key=lambda _: _['total'], reverse=True)
+
+    def log(self):
+        """Display the statistics in the ``LOG`` tab."""
+        scade.tabput('LOG', 'GUI Host timings (ms)\n')  # type: ignore
+        for stat in self.get_statistics():
+            text = (
+                '{page}/{category}.{method}: count={count} total={total:.1f} '
+                'p50={p50:.1f} p95={p95:.1f} max={max:.1f}\n'
+            ).format(**stat)
+            scade.tabput('LOG', text)  # type: ignore
+
+    def save(self, path: Path):
+        """
+        Save the statistics to a JSON file.
+
+        Parameters
+        ----------
+        path : Path
+            Path of the output file.
+        """
+        path.write_text(json.dumps(self.get_statistics(), indent=2), encoding='utf-8')
+
+
+class ProxyPageClient:
+    """
+    Maintains a reference to a client page and the name of its category.
+
+    The client page is created on demand, the first time it is accessed,
+    when the proxy is initialized with the class of the client instead
+    of an instance. This class can be designated by its path, so that
+    the client's module is not imported until the page is actually needed.
+
+    Parameters
+    ----------
+    category : str
+        Name of the page.
+
+    client : IGuiHostClient | Type[IGuiHostClient] | str
+        Instance of the hosted page, its class, or the path of its class,
+        for example ``"my.module:MyPage"``.
+
+    types : List[type | str] | None
+        Classes of the selected objects the hosted page applies to, or their paths,
+        for example ``"scade.model.suite:Operator"``.
+        The hosted page is considered for any selection when None.
+    """
+
+    def __init__(
+        self,
+        category: str,
+        client: Union[IGuiHostClient, Type[IGuiHostClient], str],
+        types: Optional[List[Union[type, str]]] = None,
+    ):
+        """Initialize the proxy with a category and a client."""
+        self.category = category
+        self.types = types
+        if isinstance(client, IGuiHostClient):
+            self._client = client  # type: Optional[IGuiHostClient]
+            self.class_ = type(client)  # type: Union[Type[IGuiHostClient], str]
+        else:
+            self._client = None
+            self.class_ = client
+
+    @property
+    def client(self) -> IGuiHostClient:
+        """Return the instance of the hosted page, created on first access."""
+        if self._client is None:
+            class_ = load_class(self.class_) if isinstance(self.class_, str) else self.class_
+            self._client = class_()
+        return self._client
+
+    @property
+    def loaded(self) -> bool:
+        """Return whether the instance of the hosted page is created."""
+        return self._client is not None
+
+
+class HostPage(PropertyPageEx):
+    """
+    Defines a property page for hosting client pages.
+
+    When ``coalesce`` is set, the contexts received for the displayed selection
+    are coalesced, until its selection context is discarded: the clients are not
+    displayed again unless the page is built again.
+
+    Parameters
+    ----------
+    name : str
+        Name of the property Page.
+
+    optional : bool
+        Whether the combo box for selecting clients is hidden
+        when there is only one client.
+
+    args : Any
+        Additional parameters for the property page.
+
+    kwargs : Any
+        Additional parameters for the property page.
+    """
+
+    coalesce = False
+    """Whether the contexts of the displayed selection are coalesced, disabled by default."""
+
+    timings = None  # type: Optional[ClientTimings]
+    """Statistics of the calls to the clients, when enabled."""
+
+    def __init__(self, name: str, optional: bool, *args, **kwargs):
+        """Initialize the host page."""
+        super().__init__(50, name=name, *args, **kwargs)
+        self.tab = name
+        self.optional = optional
+
+        # registered clients
+        self.proxies: List[ProxyPageClient] = []
+        # active clients for the current selection, indexed by category
+        self.active_clients: Dict[str, ProxyPageClient] = {}
+        # active categories (sorted)
+        self.categories: List[str] = []
+        # current selected category
+        self.category = ''
+        # controls
+        self.cb_clients = None
+        # clients built for the current context, the other ones are built on demand
+        self.built_clients: List[ProxyPageClient] = []
+        # clients displayed since the last context change, the other ones are displayed on demand
+        self.displayed_clients: Set[ProxyPageClient] = set()
+        # vertical position of the clients
+        self.y_clients = c.TOP_MARGIN
+        # current and last displayed selections, and time of the display
+        self.context = None  # type: Optional[SelectionContext]
+        self.displayed_context = None  # type: Optional[SelectionContext]
+        # whether the current context is coalesced with the last displayed one
+        self.coalesced = False
+
+        # clients sorted by category, indexed by declared class of selected objects
+        self._index = None  # type: Optional[Dict[type, List[ProxyPageClient]]]
+        # clients sorted by category, with no declared classes
+        self._untyped: List[ProxyPageClient] = []
+        # clients to consider sorted by category, indexed by class of selected objects
+        self._dispatch: Dict[type, List[ProxyPageClient]] = {}
+
+    @contextmanager
+    def timing(self, proxy: ProxyPageClient, method: str) -> Iterator[None]:
+        """
+        Record the duration of a call to a client, when the statistics are enabled.
+
+        Parameters
+        ----------
+        proxy : ProxyPageClient
+            Client page proxy.
+
+        method : str
+            Name of the called method.
+        """
+        timings = self.timings
+        if timings is None:
+            yield
+        else:
+            start = time.perf_counter()
+            try:
+                yield
+            finally:
+                timings.record(self.tab, proxy.category, method, time.perf_counter() - start)
+
+    def add_client(self, proxy: ProxyPageClient):
+        """
+        Add a client to the page.
+
+        Parameters
+        ----------
+        proxy : ProxyPageClient
+            Client page proxy.
+        """
+        self.proxies.append(proxy)
+        # invalidate the index
+        self._index = None
+
+    def _build_index(self):
+        """Index the clients with the classes of objects they apply to."""
+        self._index = {}
+        self._untyped = []
+        self._dispatch = {}
+        for proxy in sorted(self.proxies, key=lambda p: p.category):
+            try:
+                types = [load_class(_) if isinstance(_, str) else _ for _ in proxy.types or []]
+            except BaseException as e:
+                # consider the client for any selection
+                scade.tabput('LOG', f'{proxy.class_}: {e}\n')  # type: ignore
+                types = []
+            if not types:
+                self._untyped.append(proxy)
+            for class_ in types:
+                self._index.setdefault(class_, []).append(proxy)
+
+    def _get_class_candidates(self, class_: type) -> List[ProxyPageClient]:
+        """Return the clients to consider for a class of selected objects."""
+        assert self._index is not None  # nosec B101  # addresses linter
+        proxies = self._dispatch.get(class_)
+        if proxies is None:
+            # consider the classes declared by the clients as well as their derived classes
+            typed = {proxy for base in class_.__mro__ for proxy in self._index.get(base, [])}
+            proxies = sorted(typed.union(self._untyped), key=lambda p: p.category)
+            self._dispatch[class_] = proxies
+        return proxies
+
+    def get_candidates(self, models: List[Any]) -> List[ProxyPageClient]:
+        """
+        Return the clients to consider for the selected models, sorted by category.
+
+        These are the clients that apply to the classes of the selected models,
+        and the ones that do not declare any classes.
+
+        Parameters
+        ----------
+        models : List[Any]
+            List of selected objects in the IDE.
+        """
+        if self._index is None:
+            self._build_index()
+        classes = {type(_) for _ in models}
+        if len(classes) == 1:
+            return self._get_class_candidates(classes.pop())
+        elif not classes:
+            return self._untyped
+        proxies = set()
+        for class_ in classes:
+            proxies.update(self._get_class_candidates(class_))
+        return sorted(proxies, key=lambda p: p.category)
+
+    def is_client_available(self, proxy: ProxyPageClient, models: List[Any]) -> bool:
+        """
+        Return whether a client is available for the current selection.
+
+        The availability is computed once per selection and stored in the selection context.
+
+        Parameters
+        ----------
+        proxy : ProxyPageClient
+            Client page proxy.
+
+        models : List[Any]
+            List of selected objects in the IDE.
+        """
+
+        def is_available() -> bool:
+            with self.timing(proxy, 'is_available'):
+                return proxy.client.is_available(models)
+
+        context = get_selection_context(models)
+        return context.get((proxy, 'is_available'), is_available)
+
+    def is_available(self, models: List[Any]) -> bool:
+        """
+        Return whether the page is available for the current selection.
+
+        The page is available for the selected models
+        if at least one of its clients is available.
+        The clients that declare the classes of objects they apply to
+        are considered only when these classes are selected.
+
+        Parameters
+        ----------
+        models : List[Any]
+            List of selected objects in the IDE.
+        """
+        self.active_clients = {}
+        self.categories = []
+        for proxy in self.get_candidates(models):
+            if not proxy.loaded:
+                try:
+                    with self.timing(proxy, 'load'):
+                        proxy.client
+                except BaseException as e:
+                    # discard the client, the error is reported once
+                    self.proxies.remove(proxy)
+                    self._index = None
+                    scade.tabput('LOG', f'{proxy.class_}: {e}\n')  # type: ignore
+                    scade.tabput('LOG', f'{traceback.format_exc()}\n')  # type: ignore
+                    continue
+            if self.is_client_available(proxy, models):
+                self.active_clients[proxy.category] = proxy
+                self.categories.append(proxy.category)
+        return len(self.categories) > 0
+
+    def on_context(self, models: List[Any]):
+        """
+        Declare the models the page should consider.
+
+        Parameters
+        ----------
+        models : List[Any]
+            List of selected objects in the IDE.
+        """
+        # coalesce the context with the last display if it is the same selection:
+        # the shared selection context is discarded when any page is validated
+        self.context = get_selection_context(models) if models else None
+        self.coalesced = (
+            self.coalesce and self.context is not None and self.context is self.displayed_context
+        )
+        if self.coalesced:
+            return
+        # the clients must be displayed again
+        self.displayed_clients = set()
+        if not models:
+            # deactivate the clients
+            for proxy in self.active_clients.values():
+                with self.timing(proxy, 'set_models'):
+                    proxy.client.set_models(models)
+            self.active_clients = {}
+            # release the references to the last selection
+            reset_selection_context()
+        else:
+            # called between is_available and on_display: the active clients
+            # are available for the selection, no need to query them again
+            for proxy in self.active_clients.values():
+                with self.timing(proxy, 'set_models'):
+                    proxy.client.set_models(models)
+
+    def on_build(self):
+        """
+        Build the property page and its selected client.
+
+        The other clients are built when selected.
+        """
+        # the new controls must be displayed
+        self.coalesced = False
+        # the controls of a previous build belong to a native page that may be destroyed:
+        # they can't be reused, reset the list of controls
+        self.controls = []
+        # alignment for the first line
+        y = c.TOP_MARGIN
+        self.cb_clients = self.add_static_combo_box(
+            y, '&Tool:', style=['dropdownlist'], on_change_selection=self.on_sel_change
+        )
+        self.cb_clients.set_items(self.categories)
+        if len(self.active_clients) > 1:
+            y += c.DY
+        else:
+            if self.optional:
+                self.cb_clients.set_visible(False)
+            else:
+                self.cb_clients.set_enable(False)
+                y += c.DY
+        self.y_clients = y
+        # activate the last active client when possible
+        if self.category not in self.active_clients:
+            self.category = self.categories[0]
+        # build only the selected client, the other ones are built when selected
+        self.built_clients = []
+        self.build_client(self.active_clients[self.category])
+
+    def build_client(self, proxy: ProxyPageClient):
+        """
+        Build the controls of a client.
+
+        Parameters
+        ----------
+        proxy : ProxyPageClient
+            Client page proxy.
+        """
+        with self.timing(proxy, 'on_build'):
+            proxy.client.on_build(self, self.y_clients)
+        self.built_clients.append(proxy)
+
+    def display_client(self, proxy: ProxyPageClient):
+        """
+        Display a client and record it as displayed.
+
+        Parameters
+        ----------
+        proxy : ProxyPageClient
+            Client page proxy.
+        """
+        with self.timing(proxy, 'on_display'):
+            proxy.client.on_display()
+        self.displayed_clients.add(proxy)
+
+    def on_display(self):
+        """
+        Display the property page and its selected client.
+
+        The hidden clients are displayed when selected.
+        """
+        assert self.cb_clients is not None  # nosec B101  # addresses linter
+        if self.coalesced:
+            # the controls are up to date
+            return
+        selected_proxy = self.active_clients.get(self.category)
+        self.cb_clients.set_selection(self.category)
+        self.displayed_clients = set()
+        for proxy in self.built_clients:
+            if proxy == selected_proxy:
+                self.display_client(proxy)
+            proxy.client.show(proxy == selected_proxy)
+        self.displayed_context = self.context
+
+    def on_validate(self):
+        """Validate the property page's clients displayed since the last context change."""
+        for proxy in self.built_clients:
+            if proxy in self.displayed_clients:
+                with self.timing(proxy, 'on_validate'):
+                    proxy.client.on_validate()
+        # the models may have been modified
+        self.displayed_context = None
+        reset_selection_context()
+
+    def on_close(self):
+        """Perform any cleaning before the page is closed."""
+        for proxy in self.built_clients:
+            with self.timing(proxy, 'on_close'):
+                proxy.client.on_close()
+        # the controls are destroyed with the page
+        self.built_clients = []
+        self.displayed_context = None
+
+    def on_layout(self):
+        """Declare the contained control's constraints."""
+        assert self.cb_clients is not None  # nosec B101  # addresses linter
+        self.cb_clients.on_layout()
+        for proxy in self.built_clients:
+            with self.timing(proxy, 'on_layout'):
+                proxy.client.on_layout()
+
+    def on_sel_change(self, combobox: ComboBox, index: int):
+        """
+        Display the selected client.
+
+        The client is built and laid out when selected for the first time,
+        and displayed if not already displayed since the last context change.
+
+        Parameters
+        ----------
+        combobox : ComboBox
+            Control initiating the notification. Unused.
+
+        index : int
+            Index of the selected element.
+        """
+        new_category = self.categories[index]
+        if new_category != self.category:
+            self.active_clients[self.category].client.show(False)
+            self.category = new_category
+            proxy = self.active_clients[self.category]
+            if proxy not in self.built_clients:
+                self.build_client(proxy)
+                with self.timing(proxy, 'on_layout'):
+                    proxy.client.on_layout()
+            if proxy not in self.displayed_clients:
+                self.display_client(proxy)
+            proxy.client.show(True)
+
+
+def _get_cache_path(std_version: int) -> Path:
+    """Return the path of the cache file for the page descriptions."""
+    directory = os.environ.get('LOCALAPPDATA') or str(Path.home())
+    return Path(directory, 'Ansys', 'scade-guitools', f'guihost{std_version}.json')
+
+
+def _get_mtimes(paths: List[str]) -> Dict[str, int]:
+    """Return the modification times of the existing input files or directories."""
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = Path(path).stat().st_mtime_ns
+        except OSError:
+            pass
+    return mtimes
+
+
+def _get_class_path(class_: Union[type, str]) -> Optional[str]:
+    """Return the path of a class, or None if the class can't be loaded from its path."""
+    if isinstance(class_, str):
+        return class_
+    path = f'{class_.__module__}:{class_.__qualname__}'
+    try:
+        return path if load_class(path) is class_ else None
+    except Exception:
+        return None
+
+
+def _get_cached_description(description: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the description with the classes serialized as paths, or None if not possible."""
+    class_path = _get_class_path(description['class'])
+    if not class_path:
+        return None
+    cached_description = dict(description, **{'class': class_path})
+    if description.get('types') is not None:
+        types = [_get_class_path(_) for _ in description['types']]
+        if None in types:
+            return None
+        cached_description['types'] = types
+    return cached_description
+
+
+def _get_record_path(entry_point: Any) -> Optional[str]:
+    """Return the path of the RECORD file of the entry point's distribution, if any."""
+    # not available with old versions of importlib_metadata
+    dist = getattr(entry_point, 'dist', None)
+    for file in (dist.files if dist else None) or []:
+        if file.name == 'RECORD':
+            return str(file.locate())
+    return None
+
+
+def _get_entry_points() -> List[Any]:
+    """Return the registered entry points of the client pages."""
+    group = 'ansys.scade.guihost'
+    return [_ for _ in importlib_metadata.entry_points(group=group) if _.name == 'pages']
+
+
+def _get_import_state() -> Tuple[List[Any], ...]:
+    """Return a copy of the import system settings that an entry point may modify."""
+    return list(sys.path), list(sys.meta_path), list(sys.path_hooks)
+
+
+def _scan_entry_point(
+    entry_point: Any, std_version: int, files: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    """Return the descriptions of the active client pages of an entry point."""
+    function = entry_point.load()
+    descriptions = function()
+    if files is not None:
+        # files to monitor for the cache: RECORD and module of the entry point
+        record = _get_record_path(entry_point)
+        if record:
+            files.append(record)
+        module = sys.modules.get(function.__module__)
+        if module and getattr(module, '__file__', None):
+            files.append(module.__file__)
+
+    active_descriptions = []
+    for description in descriptions:
+        version = description.get('version', 0)
+        expire = description.get('expire', 9999999)
+        if version > std_version or expire <= std_version:
+            continue
+        # deprecated
+        if not description.get('activate', True):
+            continue
+        if not description.get('active', True):
+            continue
+        active_descriptions.append(description)
+    return active_descriptions
+
+
+def scan_descriptions(std_version: int, files: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Return the descriptions of the client pages active for the current version of SCADE.
+
+    The descriptions are loaded from the registered entry points.
+
+    Parameters
+    ----------
+    std_version : int
+        Version of SCADE, for example ``24200`` for SCADE 2024 R2.
+
+    files : List[str] | None
+        List completed with the files related to the registered entry points, if not None.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+    """
+    descriptions = []
+    for entry_point in _get_entry_points():
+        descriptions.extend(_scan_entry_point(entry_point, std_version, files))
+    return descriptions
+
+
+def load_descriptions(std_version: int) -> List[Dict[str, Any]]:
+    """
+    Return the descriptions of the active client pages, using a local cache when possible.
+
+    The cache is invalidated when the version of SCADE or GuiHost changes,
+    when a directory of the Python path is modified, for example when
+    a distribution is installed or removed, or when a file related to
+    the registered entry points is modified.
+
+    The descriptions of an entry point are not cached, but loaded at each launch,
+    when the entry point modifies the import system, for example ``sys.path``,
+    or when a class can't be loaded from its path.
+
+    Parameters
+    ----------
+    std_version : int
+        Version of SCADE, for example ``24200`` for SCADE 2024 R2.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+    """
+    path = _get_cache_path(std_version)
+    key = {'scade': std_version, 'guihost': __version__, 'paths': _get_mtimes(sys.path)}
+    try:
+        cache = json.loads(path.read_text(encoding='utf-8'))
+        if cache['key'] == key and _get_mtimes(list(cache['files'])) == cache['files']:
+            descriptions = []
+            entry_points = None
+            for entry in cache['entry_points']:
+                if entry['volatile']:
+                    if entry_points is None:
+                        entry_points = {_.value: _ for _ in _get_entry_points()}
+                    entry_point = entry_points[entry['value']]
+                    descriptions.extend(_scan_entry_point(entry_point, std_version))
+                else:
+                    descriptions.extend(entry['descriptions'])
+            return descriptions
+    except (OSError, ValueError, KeyError, TypeError):
+        # no cache or invalid cache
+        pass
+
+    files = []  # type: List[str]
+    descriptions = []
+    entries = []
+    for entry_point in _get_entry_points():
+        import_state = _get_import_state()
+        entry_descriptions = _scan_entry_point(entry_point, std_version, files)
+        descriptions.extend(entry_descriptions)
+        # the classes are serialized with their paths
+        cached_descriptions = [_get_cached_description(_) for _ in entry_descriptions]
+        volatile = import_state != _get_import_state() or None in cached_descriptions
+        entry = {'value': entry_point.value, 'volatile': volatile}
+        if not volatile:
+            entry['descriptions'] = cached_descriptions
+        entries.append(entry)
+    cache = {'key': key, 'files': _get_mtimes(files), 'entry_points': entries}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(cache, indent=2), encoding='utf-8')
+    except (OSError, TypeError, ValueError):
+        # the cache is an optimization: ignore the errors
+        pass
+    return descriptions
@@ -92,6 +92,34 @@ class IPropertiesDataExchange(ABC):
         """
         raise NotImplementedError
 
+    def models_to_page(self, models: List[Any]):
+        """
+        Update the page with the properties read from the models.
+
+        The default implementation calls ``model_to_page`` for each model.
+
+        Parameters
+        ----------
+        models : List[Any]
+            Selected model elements.
+        """
+        for model in models:
+            self.model_to_page(model)
+
+    def page_to_models(self, models: List[Any]):
+        """
+        Update the models with the properties read from the page.
+
+        The default implementation calls ``page_to_model`` for each model.
+
+        Parameters
+        ----------
+        models : List[Any]
+            Selected model elements.
+        """
+        for model in models:
+            self.page_to_model(model)
+
 
 class IGuiHostClient(ABC):
     """Defines the interface for hosted pages."""
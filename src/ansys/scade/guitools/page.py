@@ -25,7 +25,16 @@
 """Provides an extension for the Page classes."""
 
 from abc import abstractmethod
-from typing import Any, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,  # noqa: F401  # used in a typing annotation
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from scade.model.project.stdproject import Configuration, Project
 from scade.tool.suite.gui.properties import Page as PropertyPage
@@ -39,6 +48,7 @@ from ansys.scade.guitools.control import (
     FileSelector,
     GroupRadioBox,
     ObjectComboBox,
+    ObjectSelector,
     RadioBox,
     StaticComboBox,
     StaticEdit,
@@ -58,6 +68,122 @@ _WF = 100
 Page = Union[PropertyPage, SettingsPage]
 
 
+def get_selection_signature(models: List[Any]) -> Tuple[int, ...]:
+    """
+    Return a signature of the selection, to detect selection changes.
+
+    The signature is made of the identities of the selected objects,
+    which are valid as long as the objects are referenced.
+
+    Parameters
+    ----------
+    models : List[Any]
+        List of selected objects in the IDE.
+
+    Returns
+    -------
+    Tuple[int, ...]
+    """
+    return tuple(id(_) for _ in models)
+
+
+class SelectionContext:
+    """
+    Provides values derived from a selection, computed once and shared by the pages.
+
+    The context is created when the selection changes: use
+    :func:`get_selection_context` to access the context of the current selection.
+
+    Parameters
+    ----------
+    models : List[Any]
+        List of selected objects in the IDE.
+    """
+
+    def __init__(self, models: List[Any]):
+        """Initialize the context with a selection."""
+        # keep a reference to the selected objects so that the signature remains valid
+        self.models = list(models)
+        self.signature = get_selection_signature(models)
+        self._values = {}  # type: Dict[Hashable, Any]
+
+    def get(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """
+        Return the value associated to a key, computed with ``function`` on first access.
+
+        Parameters
+        ----------
+        key : Hashable
+            Identifier of the value, for example ``"operators"``.
+
+        function : Callable[[], Any]
+            Function computing the value from the selection.
+
+        Examples
+        --------
+
+        .. code-block::
+
+            def get_selected_models(self, models: List[Any]) -> List[Any]:
+                context = get_selection_context(models)
+                return context.get('semantic', lambda: [get_semantic(_) for _ in models])
+        """
+        try:
+            return self._values[key]
+        except KeyError:
+            value = function()
+            self._values[key] = value
+            return value
+
+
+# context of the current selection
+_context = None  # type: Optional[SelectionContext]
+
+
+def get_selection_context(models: List[Any]) -> SelectionContext:
+    """
+    Return the context of a selection, created when the selection changes.
+
+    Parameters
+    ----------
+    models : List[Any]
+        List of selected objects in the IDE.
+
+    Returns
+    -------
+    SelectionContext
+    """
+    global _context
+
+    signature = get_selection_signature(models)
+    if _context is None or _context.signature != signature:
+        _context = SelectionContext(models)
+    return _context
+
+
+def reset_selection_context():
+    """Discard the context of the current selection, for example when the models are modified."""
+    global _context
+
+    _context = None
+
+
+def reset_ddx(ddx: Any):
+    """
+    Discard the data cached by a data exchange instance, if any, when the selection changes.
+
+    Parameters
+    ----------
+    ddx : Any
+        Data exchange instance, for example an instance of
+        :class:`DataExchange <ansys.scade.guitools.data.DataExchange>`.
+    """
+    # ignore data exchange instances not defining the function
+    reset = getattr(ddx, 'reset', None)
+    if reset:
+        reset()
+
+
 class ContainerPage:
     """
     Base class for property or settings pages.
@@ -159,6 +285,14 @@ class ContainerPage:
         self.controls.append(cb)
         return cb
 
+    def add_object_selector(self, y: int, text: str, **kwargs) -> ObjectSelector:
+        """Add a :class:`ObjectSelector <ansys.scade.guitools.control.ObjectSelector>` control to the page."""
+        wl = kwargs.pop('wl', self.label_width)
+        x = kwargs.pop('x', c.LEFT_MARGIN)
+        selector = ObjectSelector(self.page, text, wl, x, y, _WF, **kwargs)
+        self.controls.append(selector)
+        return selector
+
     def add_radio_box(self, y: int, buttons: List[Tuple[Any, str]], **kwargs) -> RadioBox:
         """Add a :class:`RadioBox <ansys.scade.guitools.control.RadioBox>` control to the page."""
         x = kwargs.pop('x', c.LEFT_MARGIN)
@@ -236,6 +370,8 @@ class SettingsPageEx(SettingsPage, ContainerPage):
         """Update the project with the properties read from the page."""
         if self.ddx:
             self.ddx.page_to_model(project, configuration)
+        # the values derived from the project may be obsolete
+        reset_selection_context()
 
     @abstractmethod
     def on_build_ex(self) -> Optional[ISettingsDataExchange]:
@@ -292,18 +428,19 @@ class PropertyPageEx(PropertyPage, ContainerPage):
             List of selected objects in the IDE.
         """
         self.models = models
+        reset_ddx(self.ddx)
 
     def on_display(self):
         """Update the page with the properties read from the models."""
         if self.ddx:
-            for model in self.models:
-                self.ddx.model_to_page(model)
+            self.ddx.models_to_page(self.models)
 
     def on_validate(self):
         """Update the models with the properties read from the page."""
         if self.ddx:
-            for model in self.models:
-                self.ddx.page_to_model(model)
+            self.ddx.page_to_models(self.models)
+        # the models may have been modified
+        reset_selection_context()
 
     @abstractmethod
     def on_build_ex(self) -> Optional[IPropertiesDataExchange]:
@@ -325,6 +462,26 @@ class GuiHostClientPage(IGuiHostClient, ContainerPage):
         super(IGuiHostClient, self).__init__(page=None, *args, **kwargs)
         self.ddx = None  # type: Optional[IPropertiesDataExchange]
 
+    def select_models(self, models: List[Any]) -> List[Any]:
+        """
+        Return the list of models to consider from the selection, computed once per selection.
+
+        This function caches the result of ``get_selected_models``
+        in the selection context, until the selection changes.
+
+        Parameters
+        ----------
+        models : List[Any]
+            List of selected objects in the IDE.
+
+        Returns
+        -------
+        List[Any]
+            List of objects to consider.
+        """
+        context = get_selection_context(models)
+        return context.get((self, 'selected_models'), lambda: self.get_selected_models(models))
+
     def get_selected_models(self, models: List[Any]) -> List[Any]:
         """
         Return a new list of models from the selection.
@@ -332,6 +489,9 @@ class GuiHostClientPage(IGuiHostClient, ContainerPage):
         For example, replaces selected graphical elements by their
         associated semantic ones.
 
+        Store the values shared with other pages in the selection context,
+        with :func:`get_selection_context`, to compute them once per selection.
+
         Parameters
         ----------
         models : List[Any]
@@ -353,7 +513,7 @@ class GuiHostClientPage(IGuiHostClient, ContainerPage):
         models : List[Any]
             List of selected objects in the IDE.
         """
-        return len(self.get_selected_models(models)) > 0
+        return len(self.select_models(models)) > 0
 
     def set_models(self, models: List[Any]):
         """
@@ -364,7 +524,8 @@ class GuiHostClientPage(IGuiHostClient, ContainerPage):
         models : List[Any]
             List of selected objects in the IDE.
         """
-        self.models = self.get_selected_models(models)
+        self.models = self.select_models(models)
+        reset_ddx(self.ddx)
 
     def show(self, show: bool):
         """
@@ -386,14 +547,12 @@ class GuiHostClientPage(IGuiHostClient, ContainerPage):
     def on_display(self):
         """Update the page with the properties read from the models."""
         if self.ddx:
-            for model in self.models:
-                self.ddx.model_to_page(model)
+            self.ddx.models_to_page(self.models)
 
     def on_validate(self):
         """Update the models with the properties read from the page."""
         if self.ddx:
-            for model in self.models:
-                self.ddx.page_to_model(model)
+            self.ddx.page_to_models(self.models)
 
     def on_build(self, page: PropertyPage, y: int):
         """Build the property page."""
@@ -24,8 +24,6 @@
 
 """Provides GuiHost client pages for tests."""
 
-from guihost_ut.test_client import PageAll, PagePython, PageTxt
-
 
 def pages() -> list:
     r"""
@@ -43,7 +41,8 @@ PAGE_TXT = {
     'page': 'Misc.',
     'category': 'Text',
     'optional': False,
-    'class': PageTxt,
+    # lazy loading
+    'class': 'guihost_ut.test_client:PageTxt',
 }
 
 # page for all files (*)
@@ -53,7 +52,8 @@ PAGE_ALL = {
     'page': 'Misc.',
     'category': 'All',
     'optional': False,
-    'class': PageAll,
+    # lazy loading
+    'class': 'guihost_ut.test_client:PageAll',
 }
 
 # page for Python files (PY)
@@ -63,5 +63,8 @@ PAGE_PY = {
     'page': 'Programming',
     'category': 'Python',
     'optional': True,
-    'class': PagePython,
+    # lazy loading
+    'class': 'guihost_ut.test_client:PagePython',
+    # considered only for files
+    'types': ['scade.model.project.stdproject:FileRef'],
 }
@@ -32,6 +32,7 @@ from ansys.scade.guitools.control import (
     CheckButton,
     FileSelector,
     GroupRadioBox,
+    ObjectSelector,
     PushButton,
     RadioBox,
     StaticComboBox,
@@ -61,7 +62,7 @@ class _TestControl(DialogBox):
     __test__ = False
 
     def __init__(self):
-        super().__init__('TestControl', 400, 430, style=DS.CLOSE)
+        super().__init__('TestControl', 400, 460, style=DS.CLOSE)
 
     def on_build_ex(self):
         """Build the dialog."""
@@ -110,6 +111,10 @@ class _TestControl(DialogBox):
         ocb.set_items(files)
         if files:
             ocb.set_selection(files[0])
+        # add an object selector with the files, filtered by name
+        sel = ObjectSelector(self, 'Filtered files', wl, x, y, w)
+        y += dy
+        sel.set_items(files, key=lambda file: file.name)
         # add a group radio box with two buttons
         grb = GroupRadioBox(self, 'Radio box', [('1', '&First'), ('2', '&Second')], x, y, w)
         grb.set_value('2')
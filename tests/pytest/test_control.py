@@ -0,0 +1,449 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2024 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for the controls, without native widgets."""
+
+import gc
+
+import pytest
+
+import ansys.scade.guitools.control as control
+from ansys.scade.guitools.control import (
+    ComboBox,
+    Edit,
+    ObjectComboBox,
+    ObjectSelector,
+    clear_provided_items,
+    get_items_fingerprint,
+    get_provided_items,
+)
+
+
+class NativeObjectComboBox:
+    """Replacement of the native methods of the object combo box, recording the calls."""
+
+    def __init__(self, owner, items, *args, **kwargs):
+        self.native_items = list(items)
+        self.native_selection = None
+        self.native_calls = []
+
+    def set_items(self, items):
+        self.native_calls.append('set_items')
+        self.native_items = list(items)
+        self.native_selection = None
+
+    def get_selection(self):
+        self.native_calls.append('get_selection')
+        return self.native_selection
+
+    def set_selection(self, item):
+        self.native_calls.append('set_selection')
+        found = any(_ is item for _ in self.native_items)
+        self.native_selection = item if found else None
+
+
+class NativeComboBox:
+    """Replacement of the native methods of the combo box, recording the calls."""
+
+    def __init__(self, owner, items, *args, **kwargs):
+        self.native_items = list(items)
+        self.text = ''
+        self.native_calls = []
+
+    def set_items(self, items):
+        self.native_calls.append('set_items')
+        self.native_items = list(items)
+
+    def get_name(self):
+        self.native_calls.append('get_name')
+        return self.text
+
+    def set_name(self, text):
+        self.native_calls.append('set_name')
+        self.text = text
+
+
+class NativeEditBox:
+    """Replacement of the native edit box and label."""
+
+    def __init__(self, owner, *args, on_change=None, **kwargs):
+        self.text = ''
+        self.on_change = on_change
+        self.native_calls = []
+
+    def get_name(self):
+        self.native_calls.append('get_name')
+        return self.text
+
+    def set_name(self, text):
+        self.native_calls.append('set_name')
+        self.text = text
+        # the native control notifies the modifications of the text
+        if self.on_change:
+            self.on_change(self)
+
+
+@pytest.fixture
+def native(monkeypatch):
+    """Replace the native methods of the combo boxes, and the native edit boxes and labels."""
+    for name in '__init__', 'set_items', 'get_selection', 'set_selection':
+        monkeypatch.setattr(control._ObjectComboBox, name, getattr(NativeObjectComboBox, name))
+    for name in '__init__', 'set_items', 'get_name', 'set_name':
+        monkeypatch.setattr(control._ComboBox, name, getattr(NativeComboBox, name))
+    for name in '__init__', 'get_name', 'set_name':
+        monkeypatch.setattr(control.EditBox, name, getattr(NativeEditBox, name))
+    monkeypatch.setattr(control, 'Label', NativeEditBox)
+
+
+class Item:
+    def __init__(self, name: str):
+        self.name = name
+
+    # unhashable
+    __hash__ = None  # type: ignore
+
+
+def test_object_combo_box_names(native):
+    cb = ObjectComboBox(None, 0, 0, 100)
+    items = ['a', 'b', 'a2']
+    cb.set_items(items, names=['A', 'B', 'A'])
+    # the first occurrence of a name prevails
+    cb.select_name('A')
+    assert cb.native_selection is items[0]
+    assert cb.get_selected_name() == 'A'
+    assert cb.get_item_name('a2') == 'A'
+    cb.select_name('B')
+    assert cb.get_selected_name() == 'B'
+    # unknown name or item
+    cb.select_name('C')
+    assert cb.native_selection is None
+    assert cb.get_selected_name() == ''
+    assert cb.get_item_name('c') == ''
+
+
+def test_object_combo_box_identities(native):
+    cb = ObjectComboBox(None, 0, 0, 100)
+    # unhashable items, indexed by identity
+    items = [Item('a'), Item('b')]
+    cb.set_items(items, key=lambda item: item.name)
+    cb.select_name('b')
+    assert cb.native_selection is items[1]
+    assert cb.get_selected_name() == 'b'
+    assert cb.get_item_name(items[0]) == 'a'
+    assert cb.get_item_name(Item('a')) == ''
+    # the indexes are rebuilt with the new items
+    others = [Item('a')]
+    cb.set_items(others, key=lambda item: item.name)
+    assert cb.get_item_name(items[0]) == ''
+    cb.select_name('a')
+    assert cb.native_selection is others[0]
+
+
+class IndexSelector(ObjectSelector):
+    """Object selector without native controls, for testing the index."""
+
+    def __init__(self, max_matches: int = 100):
+        self.max_matches = max_matches
+        self._indexed = (get_items_fingerprint([]), [])
+
+    def update_matches(self):
+        pass
+
+
+@pytest.mark.parametrize(
+    'text, expected',
+    [
+        # sorted by matching word
+        ('', ['Root::Alpha', 'P::BetaGamma', 'p::gamma', 'P::Gamma_Delta']),
+        ('p::', ['P::BetaGamma', 'p::gamma', 'P::Gamma_Delta']),
+        ('GAMMA', ['p::gamma', 'P::Gamma_Delta']),
+        ('beta', ['P::BetaGamma']),
+        # an underscore does not separate words
+        ('delta', []),
+        ('lpha', []),
+        ('zzz', []),
+    ],
+)
+def test_selector_match(text: str, expected: list):
+    names = ['Root::Alpha', 'P::BetaGamma', 'P::Gamma_Delta', 'p::gamma']
+    items = [Item(_) for _ in names]
+    selector = IndexSelector()
+    selector.set_items(items, key=lambda item: item.name)
+    assert [_.name for _ in selector.match(text)] == expected
+    assert selector.get_item_name(items[1]) == 'P::BetaGamma'
+
+
+def test_selector_max_matches():
+    selector = IndexSelector(max_matches=2)
+    selector.set_items(['c', 'a', 'b'])
+    assert selector.match('') == ['a', 'b']
+
+
+def test_selector_keep_selection(native):
+    selector = ObjectSelector(None, 'Name:', 50, 0, 0, 300)
+    selector.set_items(['alpha', 'beta', 'gamma'])
+    selector.select_name('beta')
+    # the selection is kept even if it does not match the filter
+    selector.filter.set_name('g')
+    assert selector.native_items == ['beta', 'gamma']
+    assert selector.get_selected_name() == 'beta'
+    selector.select_name('gamma')
+    selector.filter.set_name('a')
+    assert selector.native_items == ['gamma', 'alpha']
+    assert selector.get_selected_name() == 'gamma'
+
+
+class Model:
+    pass
+
+
+class Provider:
+    """Item provider counting its calls."""
+
+    def __init__(self, items):
+        self.items = items
+        self.calls = 0
+
+    def get_items(self):
+        self.calls += 1
+        return self.items
+
+
+@pytest.fixture
+def provider():
+    yield Provider(['a', 'b', 'c'])
+    clear_provided_items()
+
+
+def test_provided_items(provider):
+    model = Model()
+    items = get_provided_items(provider.get_items, model)
+    assert items == ['a', 'b', 'c']
+    # bound methods are equal
+    assert get_provided_items(provider.get_items, model) is items
+    assert provider.calls == 1
+    # new model
+    get_provided_items(provider.get_items, Model())
+    assert provider.calls == 2
+    # model that can't be weakly referenced
+    get_provided_items(provider.get_items, None)
+    get_provided_items(provider.get_items, None)
+    assert provider.calls == 3
+    # a new provider for each call does not accumulate
+    for _ in range(100):
+        get_provided_items(lambda: [], model)
+    assert len(control._provided_items[model]) <= control._MAX_PROVIDERS
+    clear_provided_items()
+    get_provided_items(provider.get_items, model)
+    assert provider.calls == 4
+
+
+def test_provided_items_released(provider):
+    model = Model()
+    get_provided_items(provider.get_items, model)
+    assert len(control._provided_items) == 1
+    del model
+    gc.collect()
+    assert len(control._provided_items) == 0
+
+
+def test_object_combo_box_provider(native, provider):
+    model = Model()
+    cb = ObjectComboBox(None, 0, 0, 100)
+    cb.set_item_provider(provider.get_items, model, key=str)
+    cb.select_name('b')
+    # only the current value is displayed
+    assert cb.native_items == ['b', cb.MORE_ITEMS]
+    assert cb.get_selected_name() == 'b'
+    assert provider.calls == 0
+    # the user requests the items
+    cb.set_selection(cb.MORE_ITEMS)
+    cb._on_user_change_selection(cb)
+    assert cb.native_items == ['a', 'b', 'c']
+    assert cb.native_selection == 'b'
+    assert cb.get_selected_name() == 'b'
+    assert not cb.user_modified
+    assert provider.calls == 1
+    # new build of the page: the items are cached
+    cb = ObjectComboBox(None, 0, 0, 100)
+    cb.set_item_provider(provider.get_items, model, key=str)
+    cb.select_name('c')
+    cb.add_items(['d'])
+    assert cb.native_items == ['a', 'b', 'c', 'd']
+    assert cb.get_selected_name() == 'c'
+    assert provider.calls == 1
+
+
+def test_combo_box_provider(native, provider):
+    model = Model()
+    for _ in range(2):
+        # new build of the page: the items are cached
+        cb = ComboBox(None, 0, 0, 100)
+        cb.set_item_provider(provider.get_items, model)
+        cb.set_name('b')
+        assert cb.native_items == ['a', 'b', 'c']
+        assert cb.get_name() == 'b'
+    assert provider.calls == 1
+
+
+def test_selector_provider(native, provider):
+    selector = ObjectSelector(None, 'Name:', 50, 0, 0, 300)
+    selector.set_item_provider(provider.get_items, Model())
+    selector.select_name('b')
+    # only the current value is displayed, until the filter is modified
+    assert selector.native_items == ['b']
+    assert selector.get_selected_name() == 'b'
+    assert provider.calls == 0
+    selector.filter.set_name('c')
+    assert selector.native_items == ['b', 'c']
+    assert selector.get_selected_name() == 'b'
+    assert provider.calls == 1
+
+
+def test_items_fingerprint():
+    assert get_items_fingerprint(['a', 'b']) == get_items_fingerprint(['a', 'b'])
+    assert get_items_fingerprint(['a', 'b']) != get_items_fingerprint(['b', 'a'])
+    assert get_items_fingerprint(['a', 'b']) != get_items_fingerprint(['a', 'b', 'c'])
+    items = [Item('a'), Item('b')]
+    # unhashable items: identities
+    assert get_items_fingerprint(items) == get_items_fingerprint(list(items))
+    assert get_items_fingerprint(items) != get_items_fingerprint([Item('a'), Item('b')])
+
+
+def test_object_combo_box_native_items(native):
+    cb = ObjectComboBox(None, 0, 0, 100)
+    items = ['a', 'b']
+    cb.set_items(items, names=['A', 'B'])
+    cb.set_items(list(items), names=['A', 'B'])
+    assert cb.native_calls.count('set_items') == 1
+    # same items, other names
+    cb.set_items(items, key=str)
+    assert cb.native_calls.count('set_items') == 2
+
+
+def test_object_combo_box_add_remove_items(native):
+    cb = ObjectComboBox(None, 0, 0, 100)
+    a, b, c, d = (Item(_) for _ in 'abcd')
+    cb.set_items([a, b], names=['a', 'b'])
+    cb.select_name('b')
+    # the names of the added items are required
+    with pytest.raises(ValueError):
+        cb.add_items([c])
+    cb.add_items([c], names=['c'])
+    assert cb.native_items == [a, b, c]
+    assert cb.names == ['a', 'b', 'c']
+    assert cb.get_selected_name() == 'b'
+    cb.remove_items([a])
+    assert cb.native_items == [b, c]
+    assert cb.get_selected_name() == 'b'
+    assert cb.get_item_name(a) == ''
+    # removed selection
+    cb.remove_items([b])
+    assert cb.native_selection is None
+    assert cb.get_item_name(c) == 'c'
+    # names of the existing items computed with the naming function
+    cb.set_items([a], key=lambda item: item.name)
+    cb.add_items([b])
+    cb.add_items([c, d], names=['c', 'd'])
+    assert cb.get_item_name(b) == 'b'
+    assert cb.get_item_name(d) == 'd'
+    # the items have no names
+    cb.set_items([a])
+    with pytest.raises(ValueError):
+        cb.add_items([b], names=['b'])
+    cb.add_items([b])
+    assert cb.native_items == [a, b]
+
+
+def test_combo_box_add_remove_items(native):
+    cb = ComboBox(None, 0, 0, 100)
+    cb.set_items(['a', 'b'])
+    cb.set_name('b')
+    cb.add_items(['c'])
+    assert cb.native_items == ['a', 'b', 'c']
+    assert cb.get_name() == 'b'
+    cb.remove_items(['a', 'c'])
+    assert cb.native_items == ['b']
+    assert cb.get_name() == 'b'
+    # unchanged items
+    cb.remove_items(['z'])
+    assert cb.native_calls.count('set_items') == 3
+
+
+def test_edit_shadow(native):
+    edit = Edit(None, 0, 0, 100)
+    edit.set_name('a')
+    edit.set_name('a')
+    assert edit.get_name() == 'a'
+    assert edit.native_calls == ['set_name']
+    # modification made by the user
+    edit.text = 'b'
+    edit.on_change(edit)
+    assert edit.user_modified
+    assert edit.get_name() == 'b'
+    edit.set_name('b')
+    assert edit.native_calls == ['set_name', 'get_name']
+
+
+def test_combo_box_shadow(native):
+    cb = ComboBox(None, 0, 0, 100, style=['dropdownlist'])
+    cb.set_items(['a', 'b'])
+    cb.set_name('a')
+    cb.set_name('a')
+    assert cb.native_calls == ['set_items', 'get_name', 'set_name']
+    # modification made by the user
+    cb.text = 'b'
+    cb._on_user_change_selection(cb)
+    assert cb.get_name() == 'b'
+    # not an item: the native control is queried
+    cb.set_name('z')
+    cb.get_name()
+    assert cb.native_calls[3:] == ['get_name', 'set_name', 'get_name']
+    # the text of an editable combo box is not shadowed
+    cb = ComboBox(None, 0, 0, 100)
+    cb.set_items(['a', 'b'])
+    cb.set_name('a')
+    cb.set_name('a')
+    assert cb.native_calls == ['set_items', 'get_name', 'set_name', 'get_name']
+
+
+def test_object_combo_box_shadow(native):
+    cb = ObjectComboBox(None, 0, 0, 100, style=['dropdownlist'])
+    a, b = Item('a'), Item('b')
+    cb.set_items([a, b])
+    cb.set_selection(a)
+    cb.set_selection(a)
+    assert cb.get_selection() is a
+    assert cb.native_calls == ['set_items', 'get_selection', 'set_selection']
+    # modification made by the user
+    cb.native_selection = b
+    cb._on_user_change_selection(cb)
+    assert cb.get_selection() is b
+    cb.set_selection(b)
+    assert cb.native_calls[3:] == ['get_selection']
+    # not an item: the native control is queried
+    cb.set_selection(Item('c'))
+    assert cb.get_selection() is None
+    assert cb.native_calls[4:] == ['set_selection', 'get_selection']
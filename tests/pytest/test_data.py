@@ -0,0 +1,363 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2024 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for the data exchange classes."""
+
+from pathlib import Path
+
+import pytest
+
+from ansys.scade.apitools.prop import get_pragma_json, set_pragma_json
+import ansys.scade.guitools.data as data
+from ansys.scade.guitools.data import (
+    CompositePragmaDataExchange,
+    DataExchange,
+    PragmaDataExchange,
+    SettingsDataExchange,
+    ToolPropDataExchange,
+    get_accessors_factory,
+    register_control_accessors,
+)
+from conftest import load_project, load_session
+
+PATH_PROJECT = Path(__file__).parent / 'data' / 'Project.etp'
+PATH_MODEL = Path(__file__).parent / 'ide' / 'Model.etp'
+
+
+@pytest.fixture
+def project():
+    return load_project(PATH_PROJECT)
+
+
+@pytest.fixture
+def operator():
+    session = load_session(PATH_MODEL)
+    return next(_ for _ in session.model.all_operators if _.name == 'O')
+
+
+@pytest.fixture
+def pragma_writes(monkeypatch):
+    """Record the identifiers of the pragmas written by the data exchange classes."""
+    writes = []
+
+    def record_pragma_json(object_, id, data_):
+        writes.append(id)
+        set_pragma_json(object_, id, data_)
+
+    monkeypatch.setattr(data, 'set_pragma_json', record_pragma_json)
+    return writes
+
+
+def get_configuration(project, name: str):
+    return next(_ for _ in project.configurations if _.name == name)
+
+
+def declare_tool_props(tp: ToolPropDataExchange):
+    tp.ddx_value(name='NAME', default='')
+    tp.ddx_value(name='FLAG', default=False)
+    tp.ddx_value(name='LIST', default=[])
+    tp.ddx_value(name='MISSING', default='none')
+
+
+def test_headless_update(project):
+    configuration = get_configuration(project, 'A')
+    tp = ToolPropDataExchange('T')
+    tp.ddx_value(name='NAME', default='')
+    tp.ddx_value(name='FLAG', default=False)
+
+    tp.display(project, configuration)
+    tp.set_values({'FLAG': True})
+    # NAME is not modified
+    assert tp.validate(project, configuration) == 1
+    assert project.get_scalar_tool_prop_def('T', 'NAME', '', configuration) == 'keep'
+    assert project.get_bool_tool_prop_def('T', 'FLAG', False, configuration)
+
+
+def test_headless_update_not_displayed(project):
+    tp = ToolPropDataExchange('T')
+    declare_tool_props(tp)
+
+    tp.set_values({'FLAG': True})
+    for name in 'A', 'B':
+        configuration = get_configuration(project, name)
+        # only FLAG is written
+        assert tp.validate(project, configuration) == 3
+        assert project.get_bool_tool_prop_def('T', 'FLAG', False, configuration)
+    configuration = get_configuration(project, 'A')
+    assert project.get_scalar_tool_prop_def('T', 'NAME', '', configuration) == 'keep'
+    configuration = get_configuration(project, 'B')
+    assert project.get_scalar_tool_prop_def('T', 'NAME', '', configuration) == 'other'
+    assert project.get_tool_prop_def('T', 'LIST', [], configuration) == ['a', 'b']
+
+
+def test_pragma_headless_update(operator):
+    variable = operator.inputs[0]
+    set_pragma_json(variable, 'T', {'NAME': 'keep', 'LEVEL': '1'})
+    pdx = PragmaDataExchange('T')
+    pdx.ddx_value(name='NAME', default='')
+    pdx.ddx_value(name='LEVEL', default='0')
+    pdx.ddx_value(name='FLAG', default=False)
+
+    pdx.set_values({'FLAG': True})
+    pdx.validate(variable)
+    assert get_pragma_json(variable, 'T') == {'NAME': 'keep', 'LEVEL': '1', 'FLAG': True}
+    pdx.set_values({'LEVEL': '0'})
+    pdx.validate(variable)
+    assert get_pragma_json(variable, 'T') == {'NAME': 'keep', 'FLAG': True}
+
+
+@pytest.mark.parametrize('name', ['A', 'B'])
+def test_snapshot_reads(project, name: str):
+    configuration = get_configuration(project, name)
+    tp = ToolPropDataExchange('T', snapshot=True)
+    declare_tool_props(tp)
+
+    expected = {
+        'NAME': project.get_scalar_tool_prop_def('T', 'NAME', '', configuration),
+        'FLAG': project.get_bool_tool_prop_def('T', 'FLAG', False, configuration),
+        'LIST': project.get_tool_prop_def('T', 'LIST', [], configuration),
+        'MISSING': project.get_scalar_tool_prop_def('T', 'MISSING', 'none', configuration),
+    }
+    assert tp.read_values(project, configuration) == expected
+    tp.snapshot = False
+    assert tp.read_values(project, configuration) == expected
+
+
+def test_skipped_writes(project):
+    configuration = get_configuration(project, 'A')
+    tp = ToolPropDataExchange('T')
+    declare_tool_props(tp)
+
+    tp.display(project, configuration)
+    tp.set_values({'NAME': 'new'})
+    assert tp.validate(project, configuration) == 3
+    assert project.get_scalar_tool_prop_def('T', 'NAME', '', configuration) == 'new'
+    # the values written are the ones of the project
+    assert tp.validate(project, configuration) == 4
+    # not displayed: only the property set is written
+    configuration = get_configuration(project, 'B')
+    assert tp.validate(project, configuration) == 3
+    assert project.get_scalar_tool_prop_def('T', 'NAME', '', configuration) == 'new'
+    assert project.get_tool_prop_def('T', 'LIST', [], configuration) == ['a', 'b']
+
+
+def test_settings_cache(project, monkeypatch):
+    reads = []
+    read_values = ToolPropDataExchange.read_values
+
+    def read_values_(self, project, configuration):
+        reads.append(configuration.name)
+        return read_values(self, project, configuration)
+
+    monkeypatch.setattr(ToolPropDataExchange, 'read_values', read_values_)
+    a, b = get_configuration(project, 'A'), get_configuration(project, 'B')
+    sdx = SettingsDataExchange('T')
+    declare_tool_props(sdx)
+
+    sdx.model_to_page(project, a)
+    assert sdx.get_values()['NAME'] == 'keep'
+    sdx.set_values({'NAME': 'edited'})
+    sdx.page_to_model(project, a)
+    # only the edited value is written
+    assert sdx.skipped_writes == 3
+    sdx.model_to_page(project, b)
+    assert sdx.get_values()['NAME'] == 'other'
+    # A -> B -> A: the values of A are the cached ones, up to date
+    sdx.model_to_page(project, a)
+    assert sdx.get_values()['NAME'] == 'edited'
+    assert reads == ['A', 'B']
+    sdx.page_to_model(project, a)
+    assert sdx.skipped_writes == 4
+    sdx.set_values({'FLAG': True})
+    sdx.page_to_model(project, a)
+    assert sdx.skipped_writes == 3
+    assert project.get_scalar_tool_prop_def('T', 'NAME', '', a) == 'edited'
+    assert project.get_bool_tool_prop_def('T', 'FLAG', False, a)
+    # the cache is discarded when the selection changes
+    sdx.reset()
+    sdx.model_to_page(project, a)
+    assert reads == ['A', 'B', 'A']
+
+
+def test_read_write_configurations(project):
+    tp = ToolPropDataExchange('T')
+    declare_tool_props(tp)
+
+    matrix = tp.read_configurations(project)
+    assert matrix == {
+        'A': {'NAME': 'keep', 'FLAG': False, 'LIST': [], 'MISSING': 'none'},
+        'B': {'NAME': 'other', 'FLAG': False, 'LIST': ['a', 'b'], 'MISSING': 'none'},
+    }
+    changes = {
+        # unchanged
+        'A': {'NAME': 'keep'},
+        # one modified value and an unknown property
+        'B': {'NAME': 'new', 'FLAG': False, 'UNKNOWN': 'value'},
+        # unknown configuration
+        'C': {'NAME': 'new'},
+    }
+    assert tp.write_configurations(project, changes) == 1
+    configuration = get_configuration(project, 'B')
+    assert project.get_scalar_tool_prop_def('T', 'NAME', '', configuration) == 'new'
+    matrix = tp.read_configurations(project, [configuration])
+    assert list(matrix) == ['B']
+    assert matrix['B']['NAME'] == 'new'
+
+
+def test_pragma_validate_unchanged(operator, pragma_writes):
+    variable = operator.inputs[0]
+    set_pragma_json(variable, 'T', {'NAME': 'value'})
+    pdx = PragmaDataExchange('T')
+    name = pdx.ddx_value(name='NAME', default='')
+    pdx.ddx_value(name='FLAG', default=False)
+
+    pdx.display(variable)
+    assert name.get_value() == 'value'
+    pdx.validate(variable)
+    assert pragma_writes == []
+    name.set_value('new')
+    pdx.validate(variable)
+    assert pragma_writes == ['T']
+    assert get_pragma_json(variable, 'T') == {'NAME': 'new'}
+    # the model is up to date
+    pdx.validate(variable)
+    assert pragma_writes == ['T']
+
+
+def test_composite_pragmas(operator, pragma_writes, monkeypatch):
+    variable = operator.inputs[0]
+    set_pragma_json(variable, 'T1', {'NAME': 'one'})
+    set_pragma_json(variable, 'T2', {'FLAG': True})
+    cdx = CompositePragmaDataExchange()
+    name = cdx.add_pragma('T1').ddx_value(name='NAME', default='')
+    flag = cdx.add_pragma('T2').ddx_value(name='FLAG', default=False)
+    level = cdx.add_pragma('T3').ddx_value(name='LEVEL', default='0')
+
+    def get_pragma_json_(object_, id):
+        raise AssertionError('the pragmas must be read with a single traversal')
+
+    monkeypatch.setattr(data, 'get_pragma_json', get_pragma_json_)
+    cdx.display(variable)
+    assert (name.get_value(), flag.get_value(), level.get_value()) == ('one', True, '0')
+    cdx.validate(variable)
+    assert pragma_writes == []
+    level.set_value('1')
+    cdx.validate(variable)
+    assert pragma_writes == ['T3']
+    assert get_pragma_json(variable, 'T3') == {'LEVEL': '1'}
+
+
+def test_mixed_values(operator):
+    variables = [operator.inputs[0], operator.outputs[0]]
+    set_pragma_json(variables[0], 'T', {'NAME': 'a', 'LEVEL': '1'})
+    set_pragma_json(variables[1], 'T', {'NAME': 'b', 'LEVEL': '1', 'FLAG': True})
+    pdx = PragmaDataExchange('T')
+    name = pdx.ddx_value(name='NAME', default='', mixed='<mixed>')
+    level = pdx.ddx_value(name='LEVEL', default='0')
+    flag = pdx.ddx_value(name='FLAG', default=False)
+
+    pdx.display_models(variables)
+    assert name.get_value() == '<mixed>'
+    assert level.get_value() == '1'
+    # mixed value of a Boolean: its default value
+    assert flag.get_value() is False
+    # modify only the common property
+    level.set_value('2')
+    pdx.validate_models(variables)
+    assert get_pragma_json(variables[0], 'T') == {'NAME': 'a', 'LEVEL': '2'}
+    assert get_pragma_json(variables[1], 'T') == {'NAME': 'b', 'LEVEL': '2', 'FLAG': True}
+
+
+def test_mixed_values_set_all(operator):
+    variables = [operator.inputs[0], operator.outputs[0]]
+    set_pragma_json(variables[0], 'T', {'NAME': 'a', 'LEVEL': '1'})
+    set_pragma_json(variables[1], 'T', {'LEVEL': '1', 'FLAG': True})
+    pdx = PragmaDataExchange('T')
+    name = pdx.ddx_value(name='NAME', default='')
+    pdx.ddx_value(name='LEVEL', default='0')
+    flag = pdx.ddx_value(name='FLAG', default=False)
+
+    pdx.display_models(variables)
+    # the mixed values are the ones the user sets to all the models
+    assert (name.get_value(), flag.get_value()) == ('', False)
+    name.set_value('')
+    flag.set_value(False)
+    pdx.validate_models(variables)
+    assert get_pragma_json(variables[0], 'T') == {'LEVEL': '1'}
+    assert get_pragma_json(variables[1], 'T') == {'LEVEL': '1'}
+
+
+class Control:
+    def __init__(self):
+        self.value = None
+
+    def get_value(self):
+        return self.value
+
+    def set_value(self, value):
+        self.value = value
+
+
+class DerivedControl(Control):
+    pass
+
+
+class CustomControl(DerivedControl):
+    def get_text(self):
+        return str(self.value)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Restore the registered factories after the test."""
+    monkeypatch.setattr(data, '_factories', dict(data._factories))
+    monkeypatch.setattr(data, '_resolved_factories', {})
+
+
+def test_register_control_accessors(registry):
+    def factory(control):
+        return control.get_value, control.set_value
+
+    def custom_factory(control):
+        return control.get_text, control.set_value
+
+    # not supported
+    assert get_accessors_factory(DerivedControl) is None
+    dx = DataExchange()
+    dx.ddx_control(DerivedControl(), name='IGNORED', default='')
+    assert dx.get_binding('IGNORED') is None
+    # the factory of a base class applies to the derived classes
+    register_control_accessors(Control, factory)
+    assert get_accessors_factory(DerivedControl) is factory
+    assert get_accessors_factory(CustomControl) is factory
+    # the nearest class in the method resolution order wins
+    register_control_accessors(CustomControl, custom_factory)
+    assert get_accessors_factory(DerivedControl) is factory
+    assert get_accessors_factory(CustomControl) is custom_factory
+    control = CustomControl()
+    dx.ddx_control(control, name='VALUE', default=0)
+    dx.set_values({'VALUE': 1})
+    assert control.value == 1
+    assert dx.get_values() == {'VALUE': '1'}
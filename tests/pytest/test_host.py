@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2024 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for the implementation of the GUI host."""
+
+import importlib
+import json
+import os
+from pathlib import Path
+import sys
+from typing import List
+
+import pytest
+
+import ansys.scade.guitools.host as host
+from ansys.scade.guitools.interfaces import IGuiHostClient
+from ansys.scade.guitools.page import reset_selection_context
+
+STD_VERSION = 24200
+
+PAGES_MODULE = """
+class Page:
+    pass
+
+
+def pages():
+    return [
+        {'page': 'Tab', 'category': 'Cached', 'class': Page},
+        {'page': 'Tab', 'category': 'Expired', 'class': Page, 'expire': 24200},
+        {'page': 'Tab', 'category': 'Future', 'class': Page, 'version': 25100},
+        {'page': 'Tab', 'category': 'Inactive', 'class': Page, 'active': False},
+    ]
+
+
+def volatile_pages():
+    class LocalPage:
+        pass
+
+    return [{'page': 'Tab', 'category': 'Volatile', 'class': LocalPage}]
+"""
+
+
+class Outer:
+    class Inner:
+        pass
+
+
+class Base:
+    pass
+
+
+class Derived(Base):
+    pass
+
+
+class Other:
+    pass
+
+
+class DispatchPage(host.HostPage):
+    """Host page without native page, for testing the selection of the clients."""
+
+    def __init__(self, proxies: List[host.ProxyPageClient]):
+        self.proxies = proxies
+        self._index = None
+        self._untyped = []
+        self._dispatch = {}
+
+
+class EntryPoint:
+    """Entry point of a test distribution, counting the loads."""
+
+    def __init__(self, module, name: str):
+        self.value = f'{module.__name__}:{name}'
+        self.function = getattr(module, name)
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        return self.function
+
+
+@pytest.fixture
+def pages_module(tmp_path, monkeypatch):
+    """Return a module providing client pages, and redirect the cache to a temporary directory."""
+    appdata = tmp_path / 'appdata'
+    appdata.mkdir()
+    monkeypatch.setenv('LOCALAPPDATA', str(appdata))
+    modules = tmp_path / 'modules'
+    modules.mkdir()
+    (modules / 'pages_ut.py').write_text(PAGES_MODULE)
+    monkeypatch.syspath_prepend(str(modules))
+    yield importlib.import_module('pages_ut')
+    sys.modules.pop('pages_ut', None)
+
+
+def set_entry_points(monkeypatch, entry_points):
+    monkeypatch.setattr(host, '_get_entry_points', lambda: entry_points)
+
+
+def get_categories(descriptions) -> list:
+    return [_['category'] for _ in descriptions]
+
+
+def test_cache_hit(pages_module, monkeypatch):
+    entry_point = EntryPoint(pages_module, 'pages')
+    set_entry_points(monkeypatch, [entry_point])
+
+    descriptions = host.load_descriptions(STD_VERSION)
+    assert get_categories(descriptions) == ['Cached']
+    assert descriptions[0]['class'] is pages_module.Page
+    assert host._get_cache_path(STD_VERSION).exists()
+    # the entry point is not loaded again, the class is designated by its path
+    descriptions = host.load_descriptions(STD_VERSION)
+    assert entry_point.loads == 1
+    assert get_categories(descriptions) == ['Cached']
+    assert descriptions[0]['class'] == 'pages_ut:Page'
+    assert host.load_class(descriptions[0]['class']) is pages_module.Page
+    # another version of SCADE
+    descriptions = host.load_descriptions(STD_VERSION + 100)
+    assert entry_point.loads == 2
+
+
+def test_cache_monitored_file(pages_module, monkeypatch):
+    entry_point = EntryPoint(pages_module, 'pages')
+    set_entry_points(monkeypatch, [entry_point])
+
+    host.load_descriptions(STD_VERSION)
+    # modify the module implementing the entry point
+    path = Path(pages_module.__file__)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    descriptions = host.load_descriptions(STD_VERSION)
+    assert entry_point.loads == 2
+    assert descriptions[0]['class'] is pages_module.Page
+    # the cache is up to date
+    host.load_descriptions(STD_VERSION)
+    assert entry_point.loads == 2
+
+
+def test_cache_volatile_entry_point(pages_module, monkeypatch):
+    cached = EntryPoint(pages_module, 'pages')
+    volatile = EntryPoint(pages_module, 'volatile_pages')
+    set_entry_points(monkeypatch, [volatile, cached])
+
+    host.load_descriptions(STD_VERSION)
+    descriptions = host.load_descriptions(STD_VERSION)
+    # the local class can't be loaded from its path: the entry point is scanned again
+    assert (volatile.loads, cached.loads) == (2, 1)
+    # the order of the entry points is kept
+    assert get_categories(descriptions) == ['Volatile', 'Cached']
+    assert descriptions[0]['class'].__name__ == 'LocalPage'
+
+
+@pytest.mark.parametrize('content', ['not json', '{}', '{"key": null, "files": {}}'])
+def test_cache_invalid(pages_module, monkeypatch, content: str):
+    entry_point = EntryPoint(pages_module, 'pages')
+    set_entry_points(monkeypatch, [entry_point])
+    path = host._get_cache_path(STD_VERSION)
+    path.parent.mkdir(parents=True)
+    path.write_text(content)
+
+    descriptions = host.load_descriptions(STD_VERSION)
+    assert entry_point.loads == 1
+    assert get_categories(descriptions) == ['Cached']
+    # the cache is written again
+    host.load_descriptions(STD_VERSION)
+    assert entry_point.loads == 1
+
+
+@pytest.mark.parametrize(
+    'path, expected',
+    [
+        ('ansys.scade.guitools.interfaces:IGuiHostClient', IGuiHostClient),
+        ('ansys.scade.guitools.interfaces.IGuiHostClient', IGuiHostClient),
+        ('test_host:Outer.Inner', Outer.Inner),
+    ],
+)
+def test_load_class(path: str, expected: type):
+    assert host.load_class(path) is expected
+
+
+@pytest.mark.parametrize(
+    'path', ['ansys.scade.guitools.interfaces:Unknown', 'unknown_module_host:Class']
+)
+def test_load_class_error(path: str):
+    with pytest.raises((AttributeError, ImportError)):
+        host.load_class(path)
+
+
+def test_proxy_client_on_demand(pages_module):
+    proxy = host.ProxyPageClient('Category', 'pages_ut:Page')
+    assert not proxy.loaded
+    assert isinstance(proxy.client, pages_module.Page)
+    assert proxy.loaded
+
+
+def test_get_candidates(monkeypatch):
+    # scade.tabput is defined by the IDE
+    logs = []
+    monkeypatch.setattr(host.scade, 'tabput', lambda tab, text: logs.append(text), raising=False)
+    any_ = host.ProxyPageClient('Any', 'unused:Class')
+    base = host.ProxyPageClient('Base', 'unused:Class', [Base])
+    derived = host.ProxyPageClient('Derived', 'unused:Class', ['test_host:Derived'])
+    invalid = host.ProxyPageClient('Invalid', 'unused:Class', ['unknown_module_host:Class'])
+    page = DispatchPage([derived, base, invalid, any_])
+
+    # the clients with invalid types are considered for any selection
+    assert page.get_candidates([]) == [any_, invalid]
+    assert page.get_candidates([Other()]) == [any_, invalid]
+    assert len(logs) == 1
+    assert page.get_candidates([Base(), Base()]) == [any_, base, invalid]
+    assert page.get_candidates([Derived()]) == [any_, base, derived, invalid]
+    assert page.get_candidates([Base(), Derived(), Other()]) == [any_, base, derived, invalid]
+    # the index is rebuilt when a client is added
+    typed = host.ProxyPageClient('Typed', 'unused:Class', [Other])
+    page.add_client(typed)
+    assert page.get_candidates([Other()]) == [any_, invalid, typed]
+
+
+def test_client_timings(tmp_path):
+    timings = host.ClientTimings(size=3)
+    for duration in [0.004, 0.001, 0.002, 0.003]:
+        timings.record('Page', 'A', 'on_display', duration)
+    timings.record('Page', 'B', 'is_available', 0.020)
+
+    statistics = timings.get_statistics()
+    # sorted by decreasing total
+    assert [_['category'] for _ in statistics] == ['B', 'A']
+    stat = statistics[1]
+    assert (stat['page'], stat['method'], stat['count']) == ('Page', 'on_display', 4)
+    assert stat['total'] == pytest.approx(10)
+    assert stat['max'] == pytest.approx(4)
+    # percentiles computed on the last 3 durations
+    assert stat['p50'] == pytest.approx(2)
+    assert stat['p95'] == pytest.approx(2)
+
+    path = tmp_path / 'timings.json'
+    timings.save(path)
+    assert json.loads(path.read_text()) == statistics
+
+
+class ContextPage(host.HostPage):
+    """Host page without native page and clients, for testing the coalescing of the contexts."""
+
+    coalesce = True
+
+    def __init__(self):
+        self.active_clients = {}
+        self.displayed_clients = set()
+        self.context = None
+        self.displayed_context = None
+        self.coalesced = False
+
+    def on_display(self):
+        self.displayed_context = self.context
+
+
+def test_coalesce_contexts():
+    selection = [Base()]
+    page = ContextPage()
+    page.on_context(selection)
+    assert not page.coalesced
+    page.on_display()
+    # same selection
+    page.on_context(list(selection))
+    assert page.coalesced
+    # a page is validated
+    reset_selection_context()
+    page.on_context(selection)
+    assert not page.coalesced
+    page.on_display()
+    # new selection
+    page.on_context([Other()])
+    assert not page.coalesced
+    page.on_context(selection)
+    assert not page.coalesced